@@ -42,9 +42,14 @@ def upgrade() -> None:
         sa.Column('is_active', sa.Boolean(), nullable=False, default=True),
         sa.ForeignKeyConstraint(['user_id'], ['users.id']),
     )
-    op.create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'])
+    op.create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'], unique=True)
     op.create_index('ix_api_keys_user_id', 'api_keys', ['user_id'])
     op.create_index('ix_api_keys_is_active', 'api_keys', ['is_active'])
+    # Partial index matching the auth lookup (key_hash WHERE is_active)
+    op.create_index(
+        'idx_apikey_hash_active', 'api_keys', ['key_hash'],
+        postgresql_where=sa.text('is_active = true'),
+    )
 
     # Create request_logs table
     # Note: Primary key includes request_timestamp for TimescaleDB hypertable compatibility
@@ -74,23 +79,43 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id']),
         sa.PrimaryKeyConstraint('id', 'request_timestamp'),  # Composite PK for TimescaleDB
     )
-    # Create basic indexes first (without unique constraints)
-    op.create_index('ix_request_logs_user_id', 'request_logs', ['user_id'])
-    op.create_index('ix_request_logs_provider', 'request_logs', ['provider'])
-    op.create_index('ix_request_logs_created_at', 'request_logs', ['created_at'])
+    # No single-column indexes on user_id/provider/created_at: the composite
+    # (user_id, request_timestamp) and (provider, request_timestamp) indexes
+    # below cover prefix lookups, and every extra index costs insert and
+    # VACUUM work on this write-heavy table
 
     # Convert request_logs to hypertable (TimescaleDB)
     # Note: Primary key includes partitioning column (id, request_timestamp)
     op.execute("SELECT create_hypertable('request_logs', 'request_timestamp', if_not_exists => TRUE);")
 
     # Create indexes on partitioning column after hypertable creation
-    op.create_index('ix_request_logs_request_timestamp', 'request_logs', ['request_timestamp'])
-    op.create_index('idx_user_timestamp', 'request_logs', ['user_id', 'request_timestamp'])
-    op.create_index('idx_provider_timestamp', 'request_logs', ['provider', 'request_timestamp'])
+    # CREATE INDEX CONCURRENTLY avoids blocking writes while indexes build;
+    # it cannot run inside a transaction, hence the autocommit_block
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_request_logs_request_timestamp ON request_logs (request_timestamp)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_timestamp ON request_logs (user_id, request_timestamp)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provider_timestamp ON request_logs (provider, request_timestamp)")
+        # Partial indexes covering the analytics hot paths; only completed
+        # requests are scanned there, so these stay small
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rl_user_ts_completed ON request_logs (user_id, request_timestamp) WHERE status = 'completed'")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rl_cost ON request_logs (user_id, cost_usd) WHERE status = 'completed'")
     # Note: Cannot create unique index on id alone in TimescaleDB hypertable
     # Primary key (id, request_timestamp) ensures uniqueness
     # Foreign keys to request_logs.id are handled at application level
 
+    # Chunk sizing plus compression and retention policies: chunks older than
+    # 7 days are columnstore-compressed (segmented for per-user/provider
+    # lookups, ordered to match the analytics access pattern) and chunks
+    # older than 90 days are dropped via partition drop instead of DELETE
+    op.execute("SELECT set_chunk_time_interval('request_logs', INTERVAL '1 day');")
+    op.execute("""ALTER TABLE request_logs SET (
+        timescaledb.compress,
+        timescaledb.compress_segmentby = 'user_id, provider',
+        timescaledb.compress_orderby = 'request_timestamp DESC'
+    );""")
+    op.execute("SELECT add_compression_policy('request_logs', INTERVAL '7 days');")
+    op.execute("SELECT add_retention_policy('request_logs', INTERVAL '90 days');")
+
     # Create budgets table
     op.create_table(
         'budgets',
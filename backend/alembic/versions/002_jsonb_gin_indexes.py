@@ -0,0 +1,35 @@
+"""Add GIN indexes on request_logs JSONB columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GIN indexes let containment (@>) queries on the JSONB columns use an
+    # index probe instead of a full scan. jsonb_path_ops is used because the
+    # gateway only needs @>; it is smaller and faster than the default opclass.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_request_logs_pii_entities_gin "
+            "ON request_logs USING gin (pii_entities jsonb_path_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_request_logs_guardrail_violations_gin "
+            "ON request_logs USING gin (guardrail_violations jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_request_logs_guardrail_violations_gin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_request_logs_pii_entities_gin")
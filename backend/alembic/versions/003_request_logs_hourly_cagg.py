@@ -0,0 +1,52 @@
+"""Add hourly continuous aggregate over request_logs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-20 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Pre-materialized hourly rollup so dashboard aggregations hit the
+    # aggregate instead of re-scanning raw chunks on every request.
+    # CREATE MATERIALIZED VIEW ... WITH (timescaledb.continuous) cannot run
+    # inside a transaction, hence the autocommit_block.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS request_logs_hourly
+            WITH (timescaledb.continuous) AS
+            SELECT
+                time_bucket('1 hour', request_timestamp) AS bucket,
+                user_id,
+                provider,
+                count(*) AS total_requests,
+                sum(prompt_tokens) AS total_prompt_tokens,
+                sum(completion_tokens) AS total_completion_tokens,
+                sum(total_tokens) AS total_tokens,
+                sum(cost_usd) AS total_cost,
+                avg(duration_ms) AS avg_duration_ms,
+                sum(CASE WHEN cache_hit THEN 1 ELSE 0 END) AS cache_hits,
+                sum(CASE WHEN pii_detected THEN 1 ELSE 0 END) AS pii_detections
+            FROM request_logs
+            GROUP BY 1, 2, 3
+            WITH NO DATA;
+        """)
+        op.execute("""
+            SELECT add_continuous_aggregate_policy('request_logs_hourly',
+                start_offset => INTERVAL '7 days',
+                end_offset => INTERVAL '1 minute',
+                schedule_interval => INTERVAL '1 minute');
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS request_logs_hourly;")
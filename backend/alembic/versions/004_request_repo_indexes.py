@@ -0,0 +1,51 @@
+"""Add composite covering indexes for request-list hot paths
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # get_recent/get_by_user/count_by_user filter on user_id, range on
+    # request_timestamp and sort DESC. The covering index serves the list
+    # and the spend/token sums index-only; the provider variant matches
+    # the filtered listing. With the covering index in place the plain
+    # (user_id, request_timestamp) composite is a redundant prefix.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_request_logs_user_ts "
+            "ON request_logs (user_id, request_timestamp DESC) "
+            "INCLUDE (cost_usd, total_tokens)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_request_logs_user_provider_ts "
+            "ON request_logs (user_id, provider, request_timestamp DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_timestamp")
+
+    # get_active_webhooks probes events with array containment; a partial
+    # GIN index keeps only active rows
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_webhooks_events_gin "
+        "ON webhooks USING gin (events) WHERE is_active"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_webhooks_events_gin")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_timestamp "
+            "ON request_logs (user_id, request_timestamp)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_request_logs_user_provider_ts")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_request_logs_user_ts")
@@ -0,0 +1,49 @@
+"""Add daily continuous aggregate for long-range dashboards
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-22 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Daily rollup for month-scale provider/user dashboards: two orders of
+    # magnitude fewer rows to re-aggregate than the hourly view. Duration is
+    # stored as sum + count because avg is not additive across buckets;
+    # readers divide at query time.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS request_logs_daily
+            WITH (timescaledb.continuous) AS
+            SELECT
+                time_bucket('1 day', request_timestamp) AS bucket,
+                user_id,
+                provider,
+                count(*) AS total_requests,
+                sum(total_tokens) AS total_tokens,
+                sum(cost_usd) AS total_cost,
+                sum(duration_ms) AS duration_sum,
+                count(duration_ms) AS duration_count
+            FROM request_logs
+            GROUP BY 1, 2, 3
+            WITH NO DATA;
+        """)
+        op.execute("""
+            SELECT add_continuous_aggregate_policy('request_logs_daily',
+                start_offset => INTERVAL '30 days',
+                end_offset => INTERVAL '1 hour',
+                schedule_interval => INTERVAL '5 minutes');
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS request_logs_daily;")
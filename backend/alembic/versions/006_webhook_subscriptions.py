@@ -0,0 +1,46 @@
+"""Normalize webhook event subscriptions into a join table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-23 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Dispatch-time fan-out reads this table instead of probing the
+    # events ARRAY; the composite primary key (event_type, webhook_id)
+    # serves the lookup as a plain index scan. Webhook.events stays the
+    # source of truth for API responses.
+    op.create_table(
+        'webhook_subscriptions',
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('webhook_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['webhook_id'], ['webhooks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('event_type', 'webhook_id'),
+    )
+    op.execute("""
+        INSERT INTO webhook_subscriptions (webhook_id, event_type)
+        SELECT id, unnest(events) FROM webhooks
+        ON CONFLICT DO NOTHING;
+    """)
+    # The ARRAY containment path is gone, so the GIN index only costs
+    # write amplification now
+    op.execute("DROP INDEX IF EXISTS ix_webhooks_events_gin;")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_webhooks_events_gin
+        ON webhooks USING gin (events) WHERE is_active;
+    """)
+    op.drop_table('webhook_subscriptions')
@@ -0,0 +1,35 @@
+"""Admin endpoints for operational introspection."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import get_db, get_admin_user
+
+router = APIRouter()
+
+
+@router.get("/db/slow")
+async def get_slow_queries(
+    limit: int = Query(20, le=100),
+    db: AsyncSession = Depends(get_db),
+    is_admin: bool = Depends(get_admin_user),
+):
+    """Get the most expensive statements from pg_stat_statements (admin only)."""
+    try:
+        result = await db.execute(
+            text("""
+                SELECT query, calls, mean_exec_time, total_exec_time, rows
+                FROM pg_stat_statements
+                ORDER BY total_exec_time DESC
+                LIMIT :limit
+            """),
+            {"limit": limit},
+        )
+        return [dict(row) for row in result.mappings()]
+    except Exception:
+        await db.rollback()
+        raise HTTPException(
+            status_code=503,
+            detail="pg_stat_statements is not available; add it to shared_preload_libraries and CREATE EXTENSION pg_stat_statements",
+        )
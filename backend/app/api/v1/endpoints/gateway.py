@@ -24,7 +24,8 @@ async def chat_completions(
     try:
         response = await gateway_service.process_request(
             user_id=user.id,
-            messages=[{"role": msg.role, "content": msg.content} for msg in request.messages],
+            # Single pydantic-core dump instead of a Python-level dict per message
+            messages=request.model_dump(mode="python")["messages"],
             model=request.model,
             provider=request.provider,
             detection_mode=request.detection_mode or "fast",
@@ -1,6 +1,7 @@
 """Guardrail endpoints."""
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_db, get_current_user
@@ -18,19 +19,10 @@ async def list_guardrails(
     user: User = Depends(get_current_user),
 ):
     """List guardrail rules."""
-    rules = []
-    for rule in guardrail_engine._rules:
-        rules.append({
-            "name": rule.name,
-            "type": rule.rule_type,
-            "enabled": rule.enabled,
-            "severity": rule.severity,
-            "action": rule.action,
-        })
-    return rules
-
-
-@router.get("/violations", response_model=list[dict])
+    return guardrail_engine.list_rules()
+
+
+@router.get("/violations")
 async def get_violations(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -39,18 +31,24 @@ async def get_violations(
     """Get recent guardrail violations."""
     guardrail_repo = GuardrailRepository(db)
     violations = await guardrail_repo.get_recent(user_id=user.id, limit=limit)
-    
-    return [
-        {
-            "id": str(v.id),
-            "user_id": str(v.user_id),
-            "request_id": str(v.request_id) if v.request_id else None,
-            "rule_name": v.rule_name,
-            "severity": v.severity,
-            "action": v.action,
-            "details": v.details,
-            "timestamp": v.timestamp.isoformat(),
-        }
-        for v in violations
-    ]
+
+    # orjson serializes UUID and datetime natively in C, so no per-row
+    # str()/isoformat() calls are needed
+    payload = orjson.dumps(
+        [
+            {
+                "id": v.id,
+                "user_id": v.user_id,
+                "request_id": v.request_id,
+                "rule_name": v.rule_name,
+                "severity": v.severity,
+                "action": v.action,
+                "details": v.details,
+                "timestamp": v.timestamp,
+            }
+            for v in violations
+        ],
+        option=orjson.OPT_SERIALIZE_UUID | orjson.OPT_NAIVE_UTC,
+    )
+    return Response(content=payload, media_type="application/json")
 
@@ -1,5 +1,9 @@
 """Health check endpoint."""
 
+import asyncio
+import time
+from typing import Optional
+
 from fastapi import APIRouter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,10 +14,78 @@ import redis.asyncio as aioredis
 
 router = APIRouter()
 
+# Pooled client reused across probes; creating a connection per /health call
+# costs a TCP handshake on every probe under frequent liveness checks
+_redis = aioredis.from_url(
+    settings.redis_url,
+    max_connections=4,
+    health_check_interval=30,
+)
+
+
+async def close_health_redis():
+    """Close the pooled health-check Redis client (called on app shutdown)."""
+    await _redis.aclose()
+
+
+async def _check_database() -> tuple:
+    """Check database connectivity."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(text("SELECT 1"))
+        return "database", "healthy"
+    except Exception as e:
+        return "database", f"unhealthy: {str(e)}"
+
+
+async def _check_redis() -> tuple:
+    """Check Redis connectivity."""
+    try:
+        await _redis.ping()
+        return "redis", "healthy"
+    except Exception as e:
+        return "redis", f"unhealthy: {str(e)}"
+
+
+async def _check_models() -> tuple:
+    """Check spaCy model availability."""
+    try:
+        from app.pii.nlp_models import nlp_models
+        # Model loading is synchronous; keep it off the event loop
+        await asyncio.to_thread(nlp_models.get_turkish_model)
+        await asyncio.to_thread(nlp_models.get_english_model)
+        return "models", "healthy"
+    except Exception as e:
+        return "models", f"unhealthy: {str(e)}"
+
+
+# Cache results briefly so probe bursts (LB + k8s + Prometheus) don't each
+# trigger a full round of checks
+_CACHE_TTL = 1.0
+_cached: Optional[tuple] = None
+_refresh_lock = asyncio.Lock()
+
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
+    global _cached
+
+    if _cached and time.monotonic() - _cached[0] < _CACHE_TTL:
+        return _cached[1]
+
+    async with _refresh_lock:
+        # Another request may have refreshed while we waited for the lock
+        if _cached and time.monotonic() - _cached[0] < _CACHE_TTL:
+            return _cached[1]
+
+        health_status = await _run_checks()
+        _cached = (time.monotonic(), health_status)
+        return health_status
+
+
+async def _run_checks() -> dict:
+    """Run all health checks and aggregate the result."""
     health_status = {
         "status": "healthy",
         "checks": {
@@ -23,34 +95,22 @@ async def health_check():
         },
     }
 
-    # Check database
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute(text("SELECT 1"))
-            health_status["checks"]["database"] = "healthy"
-    except Exception as e:
-        health_status["checks"]["database"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "unhealthy"
-
-    # Check Redis
-    try:
-        redis_client = await aioredis.from_url(settings.redis_url)
-        await redis_client.ping()
-        await redis_client.aclose()
-        health_status["checks"]["redis"] = "healthy"
-    except Exception as e:
-        health_status["checks"]["redis"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "unhealthy"
+    # Run independent checks concurrently; latency is max, not sum
+    results = await asyncio.gather(
+        _check_database(),
+        _check_redis(),
+        _check_models(),
+        return_exceptions=True,
+    )
 
-    # Check spaCy models
-    try:
-        from app.pii.nlp_models import nlp_models
-        nlp_models.get_turkish_model()
-        nlp_models.get_english_model()
-        health_status["checks"]["models"] = "healthy"
-    except Exception as e:
-        health_status["checks"]["models"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "unhealthy"
+    for result in results:
+        if isinstance(result, BaseException):
+            health_status["status"] = "unhealthy"
+            continue
+        name, status = result
+        health_status["checks"][name] = status
+        if status != "healthy":
+            health_status["status"] = "unhealthy"
 
     return health_status
 
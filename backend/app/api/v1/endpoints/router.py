@@ -1,10 +1,13 @@
 """API v1 router."""
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
-from app.api.v1.endpoints import gateway, streaming, analytics, webhooks, guardrails, health
+from app.api.v1.endpoints import gateway, streaming, analytics, webhooks, guardrails, health, admin
 
-router = APIRouter()
+# orjson serializes UUID/datetime/float natively in Rust, well ahead of
+# stdlib json on the list-shaped analytics payloads
+router = APIRouter(default_response_class=ORJSONResponse)
 
 router.include_router(gateway.router, tags=["gateway"])
 router.include_router(streaming.router, tags=["streaming"])
@@ -12,4 +15,5 @@ router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"])
 router.include_router(guardrails.router, prefix="/guardrails", tags=["guardrails"])
 router.include_router(health.router, tags=["health"])
+router.include_router(admin.router, prefix="/admin", tags=["admin"])
 
@@ -2,9 +2,8 @@
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_db, get_current_user
+from app.dependencies import get_current_user
 from app.db.models.user import User
 from app.schemas.streaming import StreamingRequest
 from app.services.streaming_service import StreamingService
@@ -15,16 +14,19 @@ router = APIRouter()
 @router.post("/chat/completions/stream")
 async def stream_completions(
     request: StreamingRequest,
-    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """Streaming chat completions endpoint."""
-    streaming_service = StreamingService(db)
+    # No request-scoped session: the stream can stay open for many
+    # seconds, and StreamingService opens call-scoped sessions (see
+    # get_db_short) for any DB work it needs
+    streaming_service = StreamingService()
     
     async def generate():
         async for chunk in streaming_service.stream_completion(
             user_id=user.id,
-            messages=[{"role": msg.role, "content": msg.content} for msg in request.messages],
+            # Single pydantic-core dump instead of a Python-level dict per message
+            messages=request.model_dump(mode="python")["messages"],
             model=request.model,
             provider=request.provider,
             detection_mode=request.detection_mode or "fast",
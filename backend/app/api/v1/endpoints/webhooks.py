@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 import secrets
 
+from app.core.cache import read_cache
 from app.dependencies import get_db, get_current_user
 from app.db.models.user import User
 from app.schemas.webhook import WebhookCreate, WebhookResponse
@@ -23,8 +24,9 @@ async def create_webhook(
     """Create a webhook."""
     repo = WebhookRepository(db)
     
-    # Generate secret if not provided
-    secret = webhook.secret or f"secret_{secrets.token_urlsafe(32)}"
+    # Generate secret if not provided; the token is the entropy, a prefix
+    # only wastes bytes in the row
+    secret = webhook.secret or secrets.token_urlsafe(32)
     
     webhook_data = {
         "user_id": user.id,
@@ -34,9 +36,13 @@ async def create_webhook(
         "is_active": True,
     }
     
+    # get_db commits when the request completes; committing here too would
+    # cost an extra round-trip
     created = await repo.create(webhook_data)
-    await db.commit()
-    
+
+    # Drop cached fan-out lists for the newly subscribed events
+    await read_cache.invalidate(*(f"webhooks:{e}" for e in webhook.events))
+
     return WebhookResponse(
         id=created.id,
         url=created.url,
@@ -83,7 +89,7 @@ async def delete_webhook(
         raise HTTPException(status_code=404, detail="Webhook not found")
     
     await repo.delete(webhook_id)
-    await db.commit()
-    
+    await read_cache.invalidate(*(f"webhooks:{e}" for e in webhook.events))
+
     return {"success": True}
 
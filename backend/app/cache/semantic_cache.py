@@ -2,12 +2,15 @@
 
 import json
 from typing import Optional, Dict, Any
+import msgpack
 import numpy as np
 import redis.asyncio as aioredis
+import zstandard as zstd
+from redis.commands.search.query import Query
 
 from app.config import config_manager, settings
 from app.embeddings.factory import embedding_factory
-from app.cache.similarity import cosine_similarity
+from app.cache.similarity import batch_cosine_similarity, dequantize_int8, quantize_int8
 from app.core.exceptions import CacheException
 from app.utils.logger import get_logger
 
@@ -23,6 +26,25 @@ class SemanticCache:
         self._index_name = config_manager.get("cache.index_name", "semantic_cache")
         self._vector_dimension = config_manager.get("cache.vector_dimension", 1536)
         self._embedding_provider = None
+        # Set to False when the RediSearch module is unavailable; without the
+        # FLOAT32 HNSW index we can store int8-quantized vectors instead
+        self._search_available = True
+        # Persistent zstd contexts; creating them per call is the expensive part
+        self._compressor = zstd.ZstdCompressor(level=3)
+        self._decompressor = zstd.ZstdDecompressor()
+
+    def _serialize_response(self, response: Dict[str, Any]) -> bytes:
+        """Serialize a response payload as zstd-compressed msgpack."""
+        return self._compressor.compress(msgpack.packb(response, use_bin_type=True))
+
+    def _deserialize_response(self, payload: bytes) -> Dict[str, Any]:
+        """Deserialize a cached payload, tolerating legacy JSON entries."""
+        try:
+            return msgpack.unpackb(self._decompressor.decompress(payload), raw=False)
+        except (zstd.ZstdError, msgpack.UnpackException, ValueError, TypeError):
+            if isinstance(payload, bytes):
+                payload = payload.decode()
+            return json.loads(payload)
 
     async def initialize(self):
         """Initialize Redis connection and create vector index."""
@@ -43,6 +65,11 @@ class SemanticCache:
             info = await self.redis.ft(self._index_name).info()
             if info:
                 return
+        except aioredis.ResponseError as e:
+            if "unknown command" in str(e).lower():
+                # No RediSearch; lookups use the scan fallback
+                self._search_available = False
+                return
         except Exception:
             pass
 
@@ -84,56 +111,109 @@ class SemanticCache:
         try:
             # Generate query embedding
             embedding_response = await self._embedding_provider.embed(query_text)
-            query_vector = embedding_response.embedding.tolist()
-
-            # Simple approach: scan all cache keys and check similarity
-            # This is less efficient but works without RediSearch
-            cursor = 0
-            best_match = None
-            best_similarity = 0.0
-            
-            while True:
-                cursor, keys = await self.redis.scan(cursor, match="cache:*", count=100)
-                
-                for key in keys:
-                    try:
-                        # Get cached data
-                        cached_data = await self.redis.hgetall(key)
-                        if not cached_data:
-                            continue
-                            
-                        cached_text = cached_data.get(b"text", b"").decode() if isinstance(cached_data.get(b"text"), bytes) else cached_data.get("text", "")
-                        cached_response = cached_data.get(b"response", b"").decode() if isinstance(cached_data.get(b"response"), bytes) else cached_data.get("response", "")
-                        vector_data = cached_data.get(b"vector", b"") if isinstance(cached_data.get(b"vector"), bytes) else cached_data.get("vector", b"")
-                        
-                        if not vector_data or not cached_response:
-                            continue
-                            
-                        # Calculate similarity
-                        cached_vector = np.frombuffer(vector_data, dtype=np.float32)
-                        similarity = cosine_similarity(query_vector, cached_vector.tolist())
-                        
-                        if similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match = cached_response
-                    except Exception as e:
-                        # Skip invalid cache entries
-                        continue
-                
-                if cursor == 0:
-                    break
-            
-            # Check if best match meets threshold
-            if best_match and best_similarity >= self._similarity_threshold:
-                return json.loads(best_match)
+            query_vector = embedding_response.embedding.astype(np.float32)
 
-            return None
+            if not self._search_available:
+                return await self._scan_search(query_vector)
+
+            try:
+                return await self._knn_search(query_vector)
+            except aioredis.ResponseError:
+                # RediSearch module unavailable; fall back to scanning
+                return await self._scan_search(query_vector)
         except Exception as e:
             # Log error but don't fail request
             logger = get_logger(__name__)
             logger.warning(f"Cache get error: {e}")
             return None
 
+    async def _knn_search(self, query_vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Look up the nearest cached entry via the HNSW index."""
+        # Single KNN query against the HNSW index (COSINE distance). Only
+        # the score comes back through the search reply: redis-py decodes
+        # returned search fields as utf-8 with errors ignored, which would
+        # corrupt the zstd+msgpack response payload, so on a hit the
+        # payload is fetched raw with HGET instead
+        query = (
+            Query("*=>[KNN 1 @vector $vec AS score]")
+            .return_fields("score")
+            .dialect(2)
+        )
+        results = await self.redis.ft(self._index_name).search(
+            query, query_params={"vec": query_vector.tobytes()}
+        )
+
+        if not results.docs:
+            return None
+
+        doc = results.docs[0]
+        # RediSearch returns COSINE distance (1 - similarity)
+        similarity = 1 - float(doc.score)
+        if similarity >= self._similarity_threshold:
+            payload = await self.redis.hget(doc.id, "response")
+            if payload is None:
+                # Entry expired between the search and the fetch
+                return None
+            return self._deserialize_response(payload)
+
+        return None
+
+    # Above this score the entry is effectively a duplicate query; no later
+    # candidate can beat it meaningfully, so stop scanning
+    _EARLY_EXIT_SIMILARITY = 0.999
+
+    async def _scan_search(self, query_vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Fallback lookup without RediSearch: scan cache keys and score in bulk."""
+        cursor = 0
+        best_score = -1.0
+        best_response = None
+
+        while True:
+            cursor, keys = await self.redis.scan(cursor, match="cache:*", count=500)
+
+            if keys:
+                # Fetch all entries in one round-trip instead of one per key
+                pipe = self.redis.pipeline(transaction=False)
+                for key in keys:
+                    pipe.hmget(key, "vector", "response", "scale")
+                results = await pipe.execute()
+
+                vectors = []
+                responses = []
+                for vector_data, cached_response, scale in results:
+                    if not vector_data or not cached_response:
+                        continue
+
+                    if scale is not None:
+                        # int8-quantized entry: dequantize with its scale
+                        vector = dequantize_int8(
+                            np.frombuffer(vector_data, dtype=np.int8), float(scale)
+                        )
+                    else:
+                        vector = np.frombuffer(vector_data, dtype=np.float32)
+
+                    vectors.append(vector)
+                    responses.append(cached_response)
+
+                if vectors:
+                    # Score this page's candidates in one matrix-vector product
+                    scores = batch_cosine_similarity(np.stack(vectors), query_vector)
+                    idx = int(np.argmax(scores))
+                    if scores[idx] > best_score:
+                        best_score = float(scores[idx])
+                        best_response = responses[idx]
+
+                    if best_score >= self._EARLY_EXIT_SIMILARITY:
+                        break
+
+            if cursor == 0:
+                break
+
+        if best_response is not None and best_score >= self._similarity_threshold:
+            return self._deserialize_response(best_response)
+
+        return None
+
     async def set(self, query_text: str, response: Dict[str, Any]) -> None:
         """
         Cache a response.
@@ -146,23 +226,34 @@ class SemanticCache:
             return
 
         try:
-            # Generate embedding
+            # Generate embedding and store as a unit vector so lookups
+            # only need a dot product (cosine == dot for unit vectors)
             embedding_response = await self._embedding_provider.embed(query_text)
-            vector = embedding_response.embedding
+            vector = embedding_response.embedding.astype(np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector = vector / norm
 
             # Create cache key
             import hashlib
             cache_key = f"cache:{hashlib.md5(query_text.encode()).hexdigest()}"
 
+            mapping = {
+                "vector": vector.tobytes(),
+                "text": query_text,
+                "response": self._serialize_response(response),
+            }
+
+            if not self._search_available:
+                # No FLOAT32 HNSW index to feed: store the vector int8-quantized
+                # with a per-vector scale, cutting vector bytes 4x on the
+                # scan-fallback path
+                quantized, scale = quantize_int8(vector)
+                mapping["vector"] = quantized.tobytes()
+                mapping["scale"] = scale
+
             # Store in Redis hash
-            await self.redis.hset(
-                cache_key,
-                mapping={
-                    "vector": vector.tobytes(),
-                    "text": query_text,
-                    "response": json.dumps(response),
-                }
-            )
+            await self.redis.hset(cache_key, mapping=mapping)
 
             # Set TTL
             await self.redis.expire(cache_key, self._ttl)
@@ -1,37 +1,89 @@
 """Similarity calculation utilities."""
 
+from typing import Tuple
+
 import numpy as np
-from typing import Union, List
 
 
-def cosine_similarity(vec1: Union[np.ndarray, List[float]], vec2: Union[np.ndarray, List[float]]) -> float:
+def quantize_int8(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize a float32 vector to int8 with a per-vector scale.
+
+    Cuts storage 4x versus float32 while preserving cosine ranking to
+    well under the cache similarity threshold's resolution.
+
+    Args:
+        vec: (D,) float32 vector
+
+    Returns:
+        Tuple of (int8 vector, scale); dequantize as q * scale / 127
+    """
+    scale = float(np.max(np.abs(vec))) or 1.0
+    quantized = np.round(vec / scale * 127).astype(np.int8)
+    return quantized, scale
+
+
+def dequantize_int8(quantized: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Restore a float32 vector from its int8 quantization.
+
+    Args:
+        quantized: (D,) int8 vector
+        scale: Per-vector scale recorded at quantization time
+
+    Returns:
+        (D,) float32 vector
+    """
+    vec = quantized.astype(np.float32)
+    vec *= scale / 127.0
+    return vec
+
+
+def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     Calculate cosine similarity between two vectors.
 
     Args:
-        vec1: First vector
-        vec2: Second vector
+        vec1: First vector (float32 ndarray)
+        vec2: Second vector (float32 ndarray)
 
     Returns:
         Cosine similarity score (0-1)
     """
-    vec1 = np.array(vec1, dtype=np.float32)
-    vec2 = np.array(vec2, dtype=np.float32)
+    denom = np.sqrt(vec1 @ vec1) * np.sqrt(vec2 @ vec2)
 
-    dot_product = np.dot(vec1, vec2)
-    norm1 = np.linalg.norm(vec1)
-    norm2 = np.linalg.norm(vec2)
-
-    if norm1 == 0 or norm2 == 0:
+    if denom == 0:
         return 0.0
 
-    similarity = dot_product / (norm1 * norm2)
-    return float(similarity)
+    return float((vec1 @ vec2) / denom)
+
+
+def batch_cosine_similarity(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    Calculate cosine similarity between a query vector and a matrix of vectors.
+
+    Computes all scores in a single matrix-vector product instead of one
+    dot product per row.
+
+    Args:
+        matrix: (N, D) float32 matrix of candidate vectors
+        query: (D,) float32 query vector
+
+    Returns:
+        (N,) array of cosine similarity scores
+    """
+    query_norm = np.sqrt(query @ query)
+    if query_norm == 0:
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+
+    row_norms = np.linalg.norm(matrix, axis=1)
+    row_norms[row_norms == 0] = 1.0
+    return (matrix @ query) / (row_norms * query_norm)
 
 
 def is_similar(
-    vec1: Union[np.ndarray, List[float]],
-    vec2: Union[np.ndarray, List[float]],
+    vec1: np.ndarray,
+    vec2: np.ndarray,
     threshold: float = 0.95,
 ) -> bool:
     """
@@ -0,0 +1,90 @@
+"""Redis-backed read cache for hot, low-churn lookups."""
+
+from typing import Any, Optional
+import msgpack
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReadCache:
+    """Small msgpack-over-Redis cache with TTLs and explicit invalidation.
+
+    Used for read-mostly rows (budgets, webhook subscriptions) that are
+    consulted on every inbound request but change rarely. All operations
+    degrade to cache misses / no-ops when Redis is unavailable, so
+    callers never fail because of the cache.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+
+    async def initialize(self):
+        """Initialize Redis connection."""
+        self.redis = await aioredis.from_url(
+            settings.redis_url,
+            decode_responses=False,
+        )
+
+    async def close(self):
+        """Close Redis connection."""
+        if self.redis:
+            await self.redis.aclose()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None on miss or cache failure
+        """
+        if not self.redis:
+            return None
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Read cache get failed for {key}: {e}")
+            return None
+        if raw is None:
+            return None
+        return msgpack.unpackb(raw, raw=False)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """
+        Cache a value with a TTL.
+
+        Args:
+            key: Cache key
+            value: msgpack-serializable value
+            ttl_seconds: Expiry in seconds
+        """
+        if not self.redis:
+            return
+        try:
+            await self.redis.setex(key, ttl_seconds, msgpack.packb(value, use_bin_type=True))
+        except Exception as e:
+            logger.warning(f"Read cache set failed for {key}: {e}")
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Drop cached values.
+
+        Args:
+            keys: Cache keys to delete
+        """
+        if not self.redis or not keys:
+            return
+        try:
+            await self.redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Read cache invalidation failed for {keys}: {e}")
+
+
+# Singleton instance
+read_cache = ReadCache()
@@ -0,0 +1,21 @@
+"""Shared outbound HTTP client."""
+
+import httpx
+
+from app.config import config_manager
+
+# One connection pool for every OpenAI SDK client (chat and embeddings):
+# each AsyncOpenAI instance otherwise keeps its own pool with the SDK's
+# 100-connection default and pays separate TLS handshakes under load.
+shared_async_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_connections=config_manager.get("http.max_connections", 200),
+        max_keepalive_connections=config_manager.get("http.max_keepalive_connections", 100),
+    ),
+    timeout=httpx.Timeout(60.0),
+)
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (called on shutdown)."""
+    await shared_async_client.aclose()
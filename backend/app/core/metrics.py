@@ -58,6 +58,13 @@ cost_per_request = Histogram(
     buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
 )
 
+db_query_duration = Histogram(
+    "ai_gateway_db_query_duration_seconds",
+    "Database statement duration in seconds",
+    ["operation"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+)
+
 # Gauges
 active_requests = Gauge(
     "ai_gateway_active_requests",
@@ -1,7 +1,7 @@
 """Redis Streams-based queue for async request processing."""
 
 import asyncio
-import json
+import orjson
 from typing import Optional, Dict, Any
 import redis.asyncio as aioredis
 
@@ -52,7 +52,7 @@ class Queue:
         if self.redis:
             await self.redis.aclose()
 
-    async def enqueue(self, data: Dict[str, Any]) -> str:
+    async def enqueue(self, data: Dict[str, Any]) -> bytes:
         """
         Enqueue a request.
 
@@ -60,16 +60,17 @@ class Queue:
             data: Request data to enqueue
 
         Returns:
-            Message ID
+            Message ID as raw bytes; callers needing a str decode once
         """
         if not self._enabled or not self.redis:
             raise DatabaseException("Queue is not enabled or not initialized")
 
-        message_id = await self.redis.xadd(
+        # orjson returns bytes directly; no str round-trip before the wire,
+        # and the stream ID stays bytes end to end on this connection
+        return await self.redis.xadd(
             self._stream_name,
-            {"data": json.dumps(data)},
+            {"data": orjson.dumps(data)},
         )
-        return message_id.decode() if isinstance(message_id, bytes) else message_id
 
     async def start_workers(self, process_request_func):
         """
@@ -109,31 +110,48 @@ class Queue:
                     continue
 
                 for stream, message_list in messages:
-                    for message_id, fields in message_list:
-                        try:
-                            # Parse message data
-                            data_str = fields.get(b"data", b"{}").decode()
-                            data = json.loads(data_str)
-
-                            # Process request
-                            await process_request_func(data)
-
-                            # Acknowledge message
-                            await self.redis.xack(
-                                self._stream_name,
-                                self._consumer_group,
-                                message_id,
-                            )
-                        except Exception as e:
-                            # Log error and continue
-                            print(f"Error processing message {message_id}: {e}")
-                            # Optionally, move to dead letter queue
-                            continue
+                    # Process the whole xreadgroup batch concurrently, then
+                    # acknowledge successes in one XACK round-trip
+                    results = await asyncio.gather(
+                        *(
+                            self._process_message(message_id, fields, process_request_func)
+                            for message_id, fields in message_list
+                        ),
+                        return_exceptions=True,
+                    )
+                    ack_ids = [message_id for message_id in results if message_id is not None and not isinstance(message_id, BaseException)]
+
+                    if ack_ids:
+                        await self.redis.xack(
+                            self._stream_name,
+                            self._consumer_group,
+                            *ack_ids,
+                        )
 
             except Exception as e:
                 print(f"Worker {worker_id} error: {e}")
                 await asyncio.sleep(1)
 
+    async def _process_message(self, message_id, fields, process_request_func):
+        """
+        Process a single stream message.
+
+        Returns:
+            The message ID to acknowledge, or None on failure
+        """
+        try:
+            # Parse message data (orjson accepts bytes directly)
+            data = orjson.loads(fields.get(b"data", b"{}"))
+
+            # Process request
+            await process_request_func(data)
+            return message_id
+        except Exception as e:
+            # Log error and continue
+            print(f"Error processing message {message_id}: {e}")
+            # Optionally, move to dead letter queue
+            return None
+
 
 # Singleton instance
 queue = Queue()
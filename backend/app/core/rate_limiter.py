@@ -8,6 +8,35 @@ from app.config import config_manager, settings
 from app.core.exceptions import RateLimitException
 
 
+# Atomically bump both fixed-window counters server-side: one round-trip,
+# no TOCTOU gap, and O(1) memory per user instead of one ZSET entry per
+# request. Keys are bucketed by minute/hour so they roll over naturally.
+# Returns {1} when allowed, {0, window_seconds} when blocked.
+_RATE_LIMIT_LUA = """
+local minute_window = tonumber(ARGV[1])
+local hour_window = tonumber(ARGV[2])
+local per_minute = tonumber(ARGV[3])
+local per_hour = tonumber(ARGV[4])
+
+local minute_count = redis.call('INCR', KEYS[1])
+if minute_count == 1 then
+    redis.call('EXPIRE', KEYS[1], minute_window)
+end
+local hour_count = redis.call('INCR', KEYS[2])
+if hour_count == 1 then
+    redis.call('EXPIRE', KEYS[2], hour_window)
+end
+
+if minute_count > per_minute then
+    return {0, minute_window}
+end
+if hour_count > per_hour then
+    return {0, hour_window}
+end
+return {1}
+"""
+
+
 class RateLimiter:
     """Redis-based rate limiter using sliding window."""
 
@@ -15,6 +44,14 @@ class RateLimiter:
         self.redis: Optional[aioredis.Redis] = None
         self._enabled = config_manager.get("rate_limiting.enabled", True)
         self._tiers = config_manager.get("rate_limiting.tiers", {})
+        # Flatten tier config into (per_minute, per_hour) tuples so the
+        # per-request path is a single dict lookup
+        self._tier_limits = {
+            name: (cfg.get("requests_per_minute", 60), cfg.get("requests_per_hour", 1000))
+            for name, cfg in (self._tiers or {}).items()
+        }
+        self._default_limits = self._tier_limits.get("default", (60, 1000))
+        self._script_sha: Optional[str] = None
 
     async def initialize(self):
         """Initialize Redis connection."""
@@ -23,6 +60,7 @@ class RateLimiter:
                 settings.redis_url,
                 decode_responses=False,
             )
+            self._script_sha = await self.redis.script_load(_RATE_LIMIT_LUA)
 
     async def close(self):
         """Close Redis connection."""
@@ -53,54 +91,43 @@ class RateLimiter:
         if not self.redis:
             await self.initialize()
 
-        tier_config = self._tiers.get(tier, self._tiers.get("default", {}))
-        per_minute = tier_config.get("requests_per_minute", 60)
-        per_hour = tier_config.get("requests_per_hour", 1000)
+        per_minute, per_hour = self._tier_limits.get(tier, self._default_limits)
 
-        now = time.time()
+        now = int(time.time())
         minute_window = 60
         hour_window = 3600
 
-        # Check per-minute limit
-        minute_key = f"rate_limit:{user_id}:minute"
-        minute_count = await self.redis.zcount(
-            minute_key,
-            now - minute_window,
-            now,
-        )
+        # Counter keys bucketed on the current window; expired buckets vanish
+        minute_key = f"rate_limit:{user_id}:m:{now // minute_window}"
+        hour_key = f"rate_limit:{user_id}:h:{now // hour_window}"
 
-        if minute_count >= per_minute:
-            retry_after = int(minute_window - (now % minute_window)) + 1
-            raise RateLimitException(
-                f"Rate limit exceeded: {per_minute} requests per minute",
-                retry_after=retry_after,
-            )
+        if self._script_sha is None:
+            self._script_sha = await self.redis.script_load(_RATE_LIMIT_LUA)
 
-        # Check per-hour limit
-        hour_key = f"rate_limit:{user_id}:hour"
-        hour_count = await self.redis.zcount(
-            hour_key,
-            now - hour_window,
-            now,
-        )
+        args = (minute_window, hour_window, per_minute, per_hour)
+        try:
+            result = await self.redis.evalsha(
+                self._script_sha, 2, minute_key, hour_key, *args
+            )
+        except aioredis.ResponseError:
+            # Script cache flushed (e.g. SCRIPT FLUSH / failover); reload
+            self._script_sha = await self.redis.script_load(_RATE_LIMIT_LUA)
+            result = await self.redis.evalsha(
+                self._script_sha, 2, minute_key, hour_key, *args
+            )
 
-        if hour_count >= per_hour:
-            retry_after = int(hour_window - (now % hour_window)) + 1
+        if result[0] == 0:
+            window = int(result[1])
+            if window == minute_window:
+                limit, unit = per_minute, "minute"
+            else:
+                limit, unit = per_hour, "hour"
+            retry_after = int(window - (now % window)) + 1
             raise RateLimitException(
-                f"Rate limit exceeded: {per_hour} requests per hour",
+                f"Rate limit exceeded: {limit} requests per {unit}",
                 retry_after=retry_after,
             )
 
-        # Record request
-        await self.redis.zadd(minute_key, {str(now): now})
-        await self.redis.zadd(hour_key, {str(now): now})
-        await self.redis.expire(minute_key, minute_window)
-        await self.redis.expire(hour_key, hour_window)
-
-        # Clean old entries
-        await self.redis.zremrangebyscore(minute_key, 0, now - minute_window)
-        await self.redis.zremrangebyscore(hour_key, 0, now - hour_window)
-
         return True, None
 
 
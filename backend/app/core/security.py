@@ -1,23 +1,59 @@
 """Security utilities for API key management."""
 
+import asyncio
+import hashlib
+import hmac
 import secrets
+import time
 import bcrypt
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+from typing import Optional, Tuple
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 from app.config import settings
 from app.db.models.api_key import APIKey
 from app.db.models.user import User
+from app.db.session import AsyncSessionLocal
 from app.core.exceptions import AuthenticationException
 
 
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)
 
 
+@dataclass(frozen=True, slots=True)
+class UserDTO:
+    """Detached snapshot of an authenticated user.
+
+    Endpoints only read these attributes; a plain frozen dataclass skips
+    the declarative-mapper instantiation cost of building a throwaway
+    ``User`` per request, and being hashable it can sit in caches.
+    """
+
+    id: UUID
+    username: str
+    email: str
+    created_at: datetime
+
+# The admin row is effectively immutable; cache the detached copy so admin
+# requests skip the per-request DB roundtrip. Refreshed every 5 minutes.
+_ADMIN_CACHE_TTL = 300.0
+_admin_user_cache: Optional[Tuple[float, UserDTO]] = None
+_admin_lock = asyncio.Lock()
+
+
 def hash_api_key(api_key: str) -> str:
     """
-    Hash an API key using bcrypt.
+    Hash an API key with keyed BLAKE2b.
+
+    The digest is deterministic, so lookups can be a single indexed SELECT
+    on key_hash instead of a bcrypt check per stored key. API keys are
+    high-entropy random tokens, so a fast keyed hash is appropriate here,
+    and BLAKE2b is the fastest keyed construction hashlib offers.
 
     Args:
         api_key: The API key to hash
@@ -25,13 +61,29 @@ def hash_api_key(api_key: str) -> str:
     Returns:
         Hashed API key
     """
-    return bcrypt.hashpw(api_key.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return hashlib.blake2b(
+        api_key.encode("utf-8"),
+        key=settings.secret_key.encode("utf-8")[:64],
+        digest_size=32,
+    ).hexdigest()
+
+
+def _hmac_sha256_api_key(api_key: str) -> str:
+    """Legacy HMAC-SHA256 digest kept for keys hashed under that scheme."""
+    return hmac.new(
+        settings.secret_key.encode("utf-8"),
+        api_key.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
 
 
 def verify_api_key(api_key: str, hashed: str) -> bool:
     """
     Verify an API key against its hash.
 
+    Supports keyed BLAKE2b digests plus legacy HMAC-SHA256 digests and
+    bcrypt hashes written under earlier schemes.
+
     Args:
         api_key: The API key to verify
         hashed: The hashed API key
@@ -40,7 +92,12 @@ def verify_api_key(api_key: str, hashed: str) -> bool:
         True if the API key matches, False otherwise
     """
     try:
-        return bcrypt.checkpw(api_key.encode("utf-8"), hashed.encode("utf-8"))
+        if hashed.startswith("$2"):
+            # Legacy bcrypt hash from before the keyed-hash schemes
+            return bcrypt.checkpw(api_key.encode("utf-8"), hashed.encode("utf-8"))
+        return hmac.compare_digest(hash_api_key(api_key), hashed) or hmac.compare_digest(
+            _hmac_sha256_api_key(api_key), hashed
+        )
     except Exception:
         return False
 
@@ -57,7 +114,7 @@ def generate_api_key() -> str:
 
 async def verify_api_key_dependency(
     authorization: Optional[str] = Security(api_key_header),
-) -> User:
+) -> UserDTO:
     """
     FastAPI dependency to verify API key and return user.
 
@@ -65,7 +122,7 @@ async def verify_api_key_dependency(
         authorization: Authorization header value
 
     Returns:
-        User object
+        Detached user snapshot
 
     Raises:
         HTTPException: If authentication fails
@@ -84,61 +141,83 @@ async def verify_api_key_dependency(
 
     # Check admin key first
     if api_key == settings.admin_api_key:
-        # Return admin user from database using separate session
-        from sqlalchemy import select
-        from app.db.session import AsyncSessionLocal
-        
-        # Create a new session - it will be closed automatically
-        # Don't use begin() to avoid nested transaction issues
-        async with AsyncSessionLocal() as db_session:
-            # Execute query - session will auto-commit on close if no exception
-            result = await db_session.execute(select(User).where(User.username == "admin"))
-            admin_user = result.scalar_one_or_none()
-            if admin_user:
-                # Create a detached copy
-                detached_user = User(
-                    id=admin_user.id,
-                    username=admin_user.username,
-                    email=admin_user.email,
-                    created_at=admin_user.created_at
-                )
-                # Rollback to avoid committing (read-only operation)
-                await db_session.rollback()
-                return detached_user
-            else:
-                await db_session.rollback()
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Admin user not found in database",
-                )
+        global _admin_user_cache
+
+        if _admin_user_cache and time.monotonic() - _admin_user_cache[0] < _ADMIN_CACHE_TTL:
+            return _admin_user_cache[1]
+
+        async with _admin_lock:
+            # Re-check after acquiring the lock; another request may have
+            # refreshed the cache while we waited
+            if _admin_user_cache and time.monotonic() - _admin_user_cache[0] < _ADMIN_CACHE_TTL:
+                return _admin_user_cache[1]
+
+            # Return admin user from database using separate session
+            # Create a new session - it will be closed automatically
+            # Don't use begin() to avoid nested transaction issues
+            async with AsyncSessionLocal() as db_session:
+                # Execute query - session will auto-commit on close if no exception
+                result = await db_session.execute(select(User).where(User.username == "admin"))
+                admin_user = result.scalar_one_or_none()
+                if admin_user:
+                    detached_user = UserDTO(
+                        admin_user.id,
+                        admin_user.username,
+                        admin_user.email,
+                        admin_user.created_at,
+                    )
+                    # Rollback to avoid committing (read-only operation)
+                    await db_session.rollback()
+                    _admin_user_cache = (time.monotonic(), detached_user)
+                    return detached_user
+                else:
+                    await db_session.rollback()
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Admin user not found in database",
+                    )
 
     # Find API key in database using separate session
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
-    from app.db.session import AsyncSessionLocal
-
     # Create a new session - it will be closed automatically
     # Don't use begin() to avoid nested transaction issues
     async with AsyncSessionLocal() as db_session:
-        stmt = select(APIKey).options(selectinload(APIKey.user)).where(APIKey.is_active == True)
+        # Deterministic keyed digests: one indexed lookup instead of a bcrypt
+        # check against every active key. Both the current BLAKE2b digest and
+        # the legacy HMAC-SHA256 digest are matched in the same query.
+        candidate_hashes = [hash_api_key(api_key), _hmac_sha256_api_key(api_key)]
+        stmt = (
+            select(APIKey)
+            .options(joinedload(APIKey.user))
+            .where(APIKey.key_hash.in_(candidate_hashes), APIKey.is_active == True)
+        )
         result = await db_session.execute(stmt)
-        api_keys = result.scalars().all()
-
-        for key in api_keys:
-            if verify_api_key(api_key, key.key_hash):
-                # Get user and create a detached copy
-                user = key.user
-                # Create a new User object with same data but detached from session
-                detached_user = User(
-                    id=user.id,
-                    username=user.username,
-                    email=user.email,
-                    created_at=user.created_at
-                )
-                # Rollback to avoid committing (read-only operation)
-                await db_session.rollback()
-                return detached_user
-        
+        key = result.scalar_one_or_none()
+
+        if key is None:
+            # Migration window: fall back to scanning legacy bcrypt hashes
+            stmt = (
+                select(APIKey)
+                .options(joinedload(APIKey.user))
+                .where(APIKey.is_active == True, APIKey.key_hash.startswith("$2"))
+            )
+            result = await db_session.execute(stmt)
+            for candidate in result.scalars().all():
+                if verify_api_key(api_key, candidate.key_hash):
+                    key = candidate
+                    break
+
+        if key is not None:
+            user = key.user
+            detached_user = UserDTO(
+                user.id,
+                user.username,
+                user.email,
+                user.created_at,
+            )
+            # Rollback to avoid committing (read-only operation)
+            await db_session.rollback()
+            return detached_user
+
         await db_session.rollback()
 
     raise HTTPException(
@@ -9,6 +9,10 @@ from app.config import config_manager
 
 T = TypeVar("T")
 
+# Resolved once at import; the config is read-only after load and this
+# default is consulted on every wrapped call
+_DEFAULT_TIMEOUT = config_manager.get("timeout.default", 30)
+
 
 @asynccontextmanager
 async def with_timeout(timeout_seconds: float = None):
@@ -25,7 +29,7 @@ async def with_timeout(timeout_seconds: float = None):
         TimeoutException: If timeout occurs
     """
     if timeout_seconds is None:
-        timeout_seconds = config_manager.get("timeout.default", 30)
+        timeout_seconds = _DEFAULT_TIMEOUT
 
     try:
         yield
@@ -51,10 +55,13 @@ async def timeout_wrapper(
         TimeoutException: If timeout occurs
     """
     if timeout_seconds is None:
-        timeout_seconds = config_manager.get("timeout.default", 30)
+        timeout_seconds = _DEFAULT_TIMEOUT
 
     try:
-        return await asyncio.wait_for(coro, timeout=timeout_seconds)
-    except asyncio.TimeoutError:
+        # asyncio.timeout (3.11+) cancels in place instead of wrapping the
+        # coroutine in an extra Task the way wait_for does
+        async with asyncio.timeout(timeout_seconds):
+            return await coro
+    except TimeoutError:
         raise TimeoutException(f"Operation timed out after {timeout_seconds} seconds")
 
@@ -4,7 +4,7 @@ from app.db.models.user import User
 from app.db.models.api_key import APIKey
 from app.db.models.request_log import RequestLog
 from app.db.models.budget import Budget
-from app.db.models.webhook import Webhook
+from app.db.models.webhook import Webhook, WebhookSubscription
 from app.db.models.guardrail_log import GuardrailLog
 
 __all__ = [
@@ -13,5 +13,6 @@ __all__ = [
     "RequestLog",
     "Budget",
     "Webhook",
+    "WebhookSubscription",
     "GuardrailLog",
 ]
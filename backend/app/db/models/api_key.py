@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -14,8 +14,18 @@ class APIKey(Base):
 
     __tablename__ = "api_keys"
 
+    # Partial index covering the auth lookup (key_hash + active filter);
+    # inactive keys never take index space
+    __table_args__ = (
+        Index(
+            "idx_apikey_hash_active",
+            "key_hash",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    key_hash = Column(String(255), nullable=False, index=True)
+    key_hash = Column(String(255), nullable=False, unique=True, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
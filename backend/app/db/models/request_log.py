@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -25,11 +26,11 @@ class RequestLog(Base):
     __tablename__ = "request_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     request_timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     # Request details
-    provider = Column(String(50), nullable=False, index=True)
+    provider = Column(String(50), nullable=False)
     model = Column(String(100), nullable=False)
     messages = Column(JSONB, nullable=True)  # Store messages as JSON
     max_tokens = Column(Integer, nullable=True)
@@ -58,14 +59,39 @@ class RequestLog(Base):
     guardrail_violations = Column(JSONB, nullable=True)  # List of violations
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="requests")
 
-    # Indexes
+    # Indexes; the partial variants cover only completed requests, which is
+    # what every analytics range scan filters on, so they stay a fraction
+    # of the size of the full-table composites
     __table_args__ = (
-        Index("idx_user_timestamp", "user_id", "request_timestamp"),
+        Index(
+            "ix_request_logs_user_ts",
+            "user_id",
+            text("request_timestamp DESC"),
+            postgresql_include=["cost_usd", "total_tokens"],
+        ),
+        Index(
+            "ix_request_logs_user_provider_ts",
+            "user_id",
+            "provider",
+            text("request_timestamp DESC"),
+        ),
         Index("idx_provider_timestamp", "provider", "request_timestamp"),
+        Index(
+            "idx_rl_user_ts_completed",
+            "user_id",
+            "request_timestamp",
+            postgresql_where=text("status = 'completed'"),
+        ),
+        Index(
+            "idx_rl_cost",
+            "user_id",
+            "cost_usd",
+            postgresql_where=text("status = 'completed'"),
+        ),
     )
 
@@ -23,3 +23,20 @@ class Webhook(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+
+class WebhookSubscription(Base):
+    """Normalized (event_type, webhook) subscription row for dispatch.
+
+    Denormalized from Webhook.events, which stays the source of truth for
+    API responses; the composite primary key makes the fan-out lookup an
+    index scan on event_type with no ARRAY containment.
+    """
+
+    __tablename__ = "webhook_subscriptions"
+
+    event_type = Column(String(100), primary_key=True)
+    webhook_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("webhooks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
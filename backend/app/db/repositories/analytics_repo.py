@@ -1,9 +1,9 @@
 """Analytics repository for aggregated statistics."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from sqlalchemy import select, func, desc, and_, Integer, Boolean
+from sqlalchemy import select, func, desc, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.request_log import RequestLog
@@ -12,9 +12,24 @@ from app.db.models.request_log import RequestLog
 class AnalyticsRepository:
     """Repository for analytics and statistics operations."""
 
+    # Ranges at least this long are served from the daily rollup — two
+    # orders of magnitude fewer rows to re-aggregate than the hourly view;
+    # shorter windows keep hourly bucket-edge resolution
+    _DAILY_ROLLUP_MIN_SPAN = timedelta(days=7)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def _use_daily_rollup(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> bool:
+        """Whether a date range is long enough for the daily rollup."""
+        if start_date is None:
+            return True
+        return (end_date or datetime.utcnow()) - start_date >= self._DAILY_ROLLUP_MIN_SPAN
+
     async def get_total_stats(
         self,
         start_date: Optional[datetime] = None,
@@ -32,6 +47,16 @@ class AnalyticsRepository:
         Returns:
             Dictionary with aggregate statistics
         """
+        if start_date is None and end_date is None and user_id is None:
+            # The savepoint confines a failed attempt so the session's outer
+            # transaction stays usable for the exact-scan fallback
+            try:
+                async with self.db.begin_nested():
+                    return await self._get_approximate_total_stats()
+            except Exception:
+                # Catalog/rollup unavailable; fall back to the exact scan
+                pass
+
         query = select(
             func.count(RequestLog.id).label("total_requests"),
             func.sum(RequestLog.prompt_tokens).label("total_prompt_tokens"),
@@ -39,8 +64,10 @@ class AnalyticsRepository:
             func.sum(RequestLog.total_tokens).label("total_tokens"),
             func.sum(RequestLog.cost_usd).label("total_cost"),
             func.avg(RequestLog.duration_ms).label("avg_duration_ms"),
-            func.sum(func.cast(RequestLog.cache_hit, Integer)).label("cache_hits"),
-            func.sum(func.cast(RequestLog.pii_detected, Integer)).label("pii_detections"),
+            # count(*) FILTER (WHERE ...) instead of sum(cast(bool AS int)):
+            # no per-row cast, and the planner can satisfy it from an index
+            func.count().filter(RequestLog.cache_hit == True).label("cache_hits"),
+            func.count().filter(RequestLog.pii_detected == True).label("pii_detections"),
         )
 
         conditions = []
@@ -54,18 +81,74 @@ class AnalyticsRepository:
         if conditions:
             query = query.where(and_(*conditions))
 
-        result = await self.db.execute(query)
-        row = result.first()
+        # .mappings() hands back plain dict-like rows; skips the Row
+        # attribute-lookup machinery on these hot dashboard paths
+        row = (await self.db.execute(query)).mappings().first() or {}
 
         return {
-            "total_requests": row.total_requests or 0,
-            "total_prompt_tokens": row.total_prompt_tokens or 0,
-            "total_completion_tokens": row.total_completion_tokens or 0,
-            "total_tokens": row.total_tokens or 0,
-            "total_cost": float(row.total_cost or 0),
-            "avg_duration_ms": float(row.avg_duration_ms or 0),
-            "cache_hits": row.cache_hits or 0,
-            "pii_detections": row.pii_detections or 0,
+            "total_requests": row.get("total_requests") or 0,
+            "total_prompt_tokens": row.get("total_prompt_tokens") or 0,
+            "total_completion_tokens": row.get("total_completion_tokens") or 0,
+            "total_tokens": row.get("total_tokens") or 0,
+            "total_cost": float(row.get("total_cost") or 0),
+            "avg_duration_ms": float(row.get("avg_duration_ms") or 0),
+            "cache_hits": row.get("cache_hits") or 0,
+            "pii_detections": row.get("pii_detections") or 0,
+            "approximate": False,
+        }
+
+    async def _get_approximate_total_stats(self) -> Dict[str, Any]:
+        """
+        Get unfiltered aggregate statistics without scanning request_logs.
+
+        Uses a catalog-based row estimate for the total count and the
+        hourly rollup for the remaining sums — an O(1) catalog lookup plus
+        a small aggregate scan instead of a full table scan. Dashboard
+        totals don't need exactness.
+        """
+        # On TimescaleDB the hypertable root holds no rows (they live in
+        # chunk children), so its reltuples stays ~0; approximate_row_count
+        # aggregates the chunk estimates instead. Plain PostgreSQL reads
+        # the planner estimate straight off pg_class.
+        has_timescaledb = (await self.db.execute(text(
+            "SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'"
+        ))).scalar() is not None
+
+        if has_timescaledb:
+            count_result = await self.db.execute(text(
+                "SELECT greatest(approximate_row_count('request_logs'), 0)::bigint "
+                "AS total_requests"
+            ))
+        else:
+            count_result = await self.db.execute(text(
+                "SELECT greatest(reltuples, 0)::bigint AS total_requests "
+                "FROM pg_class WHERE oid = 'request_logs'::regclass"
+            ))
+        total_requests = count_result.scalar() or 0
+
+        rollup_result = await self.db.execute(text("""
+            SELECT
+                sum(total_prompt_tokens) AS total_prompt_tokens,
+                sum(total_completion_tokens) AS total_completion_tokens,
+                sum(total_tokens) AS total_tokens,
+                sum(total_cost) AS total_cost,
+                sum(avg_duration_ms * total_requests) / nullif(sum(total_requests), 0) AS avg_duration_ms,
+                sum(cache_hits) AS cache_hits,
+                sum(pii_detections) AS pii_detections
+            FROM request_logs_hourly
+        """))
+        row = rollup_result.mappings().first() or {}
+
+        return {
+            "total_requests": total_requests,
+            "total_prompt_tokens": row.get("total_prompt_tokens") or 0,
+            "total_completion_tokens": row.get("total_completion_tokens") or 0,
+            "total_tokens": row.get("total_tokens") or 0,
+            "total_cost": float(row.get("total_cost") or 0),
+            "avg_duration_ms": float(row.get("avg_duration_ms") or 0),
+            "cache_hits": row.get("cache_hits") or 0,
+            "pii_detections": row.get("pii_detections") or 0,
+            "approximate": True,
         }
 
     async def get_provider_stats(
@@ -83,6 +166,16 @@ class AnalyticsRepository:
         Returns:
             List of provider statistics dictionaries
         """
+        # The hourly rollup carries provider, so per-provider totals come
+        # from pre-aggregated rows instead of scanning raw chunks
+        try:
+            async with self.db.begin_nested():
+                return await self._get_provider_from_rollup(start_date, end_date)
+        except Exception:
+            # Rollup view unavailable (e.g. plain PostgreSQL); the savepoint
+            # rollback leaves the outer transaction open for the fallback
+            pass
+
         query = select(
             RequestLog.provider,
             func.count(RequestLog.id).label("total_requests"),
@@ -102,16 +195,66 @@ class AnalyticsRepository:
 
         query = query.group_by(RequestLog.provider).order_by(desc("total_requests"))
 
-        result = await self.db.execute(query)
-        rows = result.all()
+        rows = (await self.db.execute(query)).mappings().all()
 
         return [
             {
-                "provider": row.provider,
-                "total_requests": row.total_requests,
-                "total_tokens": row.total_tokens or 0,
-                "total_cost": float(row.total_cost or 0),
-                "avg_duration_ms": float(row.avg_duration_ms or 0),
+                "provider": row["provider"],
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
+            }
+            for row in rows
+        ]
+
+    async def _get_provider_from_rollup(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-provider statistics from the continuous-aggregate rollups."""
+        # The daily view stores duration as sum + count (avg is not additive
+        # across buckets), so each source carries its own avg expression
+        if self._use_daily_rollup(start_date, end_date):
+            source = "request_logs_daily"
+            avg_expr = "sum(duration_sum) / nullif(sum(duration_count), 0)"
+        else:
+            source = "request_logs_hourly"
+            avg_expr = "sum(avg_duration_ms * total_requests) / sum(total_requests)"
+
+        conditions = []
+        params: Dict[str, Any] = {}
+        if start_date:
+            conditions.append("bucket >= :start_date")
+            params["start_date"] = start_date
+        if end_date:
+            conditions.append("bucket <= :end_date")
+            params["end_date"] = end_date
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = text(f"""
+            SELECT
+                provider,
+                sum(total_requests) AS total_requests,
+                sum(total_tokens) AS total_tokens,
+                sum(total_cost) AS total_cost,
+                {avg_expr} AS avg_duration_ms
+            FROM {source}
+            {where_clause}
+            GROUP BY provider
+            ORDER BY total_requests DESC
+        """)
+
+        rows = (await self.db.execute(query, params)).mappings().all()
+
+        return [
+            {
+                "provider": row["provider"],
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
             }
             for row in rows
         ]
@@ -133,6 +276,16 @@ class AnalyticsRepository:
         Returns:
             List of user statistics dictionaries
         """
+        # Per-user totals come from pre-aggregated rollup rows, mirroring
+        # the provider and timeline paths
+        try:
+            async with self.db.begin_nested():
+                return await self._get_user_from_rollup(start_date, end_date, limit)
+        except Exception:
+            # Rollup view unavailable (e.g. plain PostgreSQL); the savepoint
+            # rollback leaves the outer transaction open for the fallback
+            pass
+
         query = select(
             RequestLog.user_id,
             func.count(RequestLog.id).label("total_requests"),
@@ -152,16 +305,66 @@ class AnalyticsRepository:
 
         query = query.group_by(RequestLog.user_id).order_by(desc("total_requests")).limit(limit)
 
-        result = await self.db.execute(query)
-        rows = result.all()
+        rows = (await self.db.execute(query)).mappings().all()
+
+        return [
+            {
+                "user_id": str(row["user_id"]),
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
+            }
+            for row in rows
+        ]
+
+    async def _get_user_from_rollup(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Get per-user statistics from the continuous-aggregate rollups."""
+        if self._use_daily_rollup(start_date, end_date):
+            source = "request_logs_daily"
+            avg_expr = "sum(duration_sum) / nullif(sum(duration_count), 0)"
+        else:
+            source = "request_logs_hourly"
+            avg_expr = "sum(avg_duration_ms * total_requests) / sum(total_requests)"
+
+        conditions = []
+        params: Dict[str, Any] = {"limit": limit}
+        if start_date:
+            conditions.append("bucket >= :start_date")
+            params["start_date"] = start_date
+        if end_date:
+            conditions.append("bucket <= :end_date")
+            params["end_date"] = end_date
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = text(f"""
+            SELECT
+                user_id,
+                sum(total_requests) AS total_requests,
+                sum(total_tokens) AS total_tokens,
+                sum(total_cost) AS total_cost,
+                {avg_expr} AS avg_duration_ms
+            FROM {source}
+            {where_clause}
+            GROUP BY user_id
+            ORDER BY total_requests DESC
+            LIMIT :limit
+        """)
+
+        rows = (await self.db.execute(query, params)).mappings().all()
 
         return [
             {
-                "user_id": str(row.user_id),
-                "total_requests": row.total_requests,
-                "total_tokens": row.total_tokens or 0,
-                "total_cost": float(row.total_cost or 0),
-                "avg_duration_ms": float(row.avg_duration_ms or 0),
+                "user_id": str(row["user_id"]),
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
             }
             for row in rows
         ]
@@ -185,21 +388,28 @@ class AnalyticsRepository:
         Returns:
             List of timeline statistics dictionaries
         """
-        # TimescaleDB time_bucket function
-        # For PostgreSQL without TimescaleDB, use date_trunc
-        if granularity == "hour":
-            time_expr = func.date_trunc("hour", RequestLog.request_timestamp)
-        elif granularity == "day":
-            time_expr = func.date_trunc("day", RequestLog.request_timestamp)
-        elif granularity == "week":
-            time_expr = func.date_trunc("week", RequestLog.request_timestamp)
-        elif granularity == "month":
-            time_expr = func.date_trunc("month", RequestLog.request_timestamp)
-        else:
-            time_expr = func.date_trunc("hour", RequestLog.request_timestamp)
+        # Serve supported granularities from the hourly continuous aggregate;
+        # re-bucketing pre-aggregated rows is far cheaper than raw chunks
+        if granularity in ("hour", "day", "week", "month"):
+            try:
+                async with self.db.begin_nested():
+                    return await self._get_timeline_from_rollup(
+                        start_date, end_date, granularity, user_id
+                    )
+            except Exception:
+                # Rollup view unavailable (e.g. plain PostgreSQL); the
+                # savepoint rollback leaves the outer transaction open for
+                # the fallback
+                pass
+
+        # Plain-PostgreSQL fallback: date_trunc instead of time_bucket, with
+        # the labeled expression reused in GROUP BY/ORDER BY so the planner
+        # folds both onto one computed sort key
+        trunc_unit = granularity if granularity in ("hour", "day", "week", "month") else "hour"
+        time_expr = func.date_trunc(trunc_unit, RequestLog.request_timestamp).label("time_bucket")
 
         query = select(
-            time_expr.label("time_bucket"),
+            time_expr,
             func.count(RequestLog.id).label("total_requests"),
             func.sum(RequestLog.total_tokens).label("total_tokens"),
             func.sum(RequestLog.cost_usd).label("total_cost"),
@@ -215,18 +425,69 @@ class AnalyticsRepository:
             conditions.append(RequestLog.user_id == user_id)
 
         query = query.where(and_(*conditions))
-        query = query.group_by("time_bucket").order_by("time_bucket")
+        query = query.group_by(time_expr).order_by(time_expr)
+
+        rows = (await self.db.execute(query)).mappings().all()
+
+        return [
+            {
+                "timestamp": row["time_bucket"].isoformat() if row["time_bucket"] else None,
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
+            }
+            for row in rows
+        ]
+
+    async def _get_timeline_from_rollup(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: str,
+        user_id: Optional[UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get timeline statistics from the continuous-aggregate rollups."""
+        # Day-or-coarser buckets re-aggregate the daily view; hourly ones
+        # need the hourly view's resolution
+        if granularity == "hour":
+            source = "request_logs_hourly"
+            avg_expr = "sum(avg_duration_ms * total_requests) / sum(total_requests)"
+        else:
+            source = "request_logs_daily"
+            avg_expr = "sum(duration_sum) / nullif(sum(duration_count), 0)"
+
+        user_filter = "AND user_id = :user_id" if user_id else ""
+        query = text(f"""
+            SELECT
+                time_bucket(CAST(:bucket_width AS INTERVAL), bucket) AS time_bucket,
+                sum(total_requests) AS total_requests,
+                sum(total_tokens) AS total_tokens,
+                sum(total_cost) AS total_cost,
+                {avg_expr} AS avg_duration_ms
+            FROM {source}
+            WHERE bucket >= :start_date AND bucket <= :end_date {user_filter}
+            GROUP BY 1
+            ORDER BY 1
+        """)
+
+        params = {
+            "bucket_width": f"1 {granularity}",
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        if user_id:
+            params["user_id"] = user_id
 
-        result = await self.db.execute(query)
-        rows = result.all()
+        rows = (await self.db.execute(query, params)).mappings().all()
 
         return [
             {
-                "timestamp": row.time_bucket.isoformat() if row.time_bucket else None,
-                "total_requests": row.total_requests,
-                "total_tokens": row.total_tokens or 0,
-                "total_cost": float(row.total_cost or 0),
-                "avg_duration_ms": float(row.avg_duration_ms or 0),
+                "timestamp": row["time_bucket"].isoformat() if row["time_bucket"] else None,
+                "total_requests": row["total_requests"],
+                "total_tokens": row["total_tokens"] or 0,
+                "total_cost": float(row["total_cost"] or 0),
+                "avg_duration_ms": float(row["avg_duration_ms"] or 0),
             }
             for row in rows
         ]
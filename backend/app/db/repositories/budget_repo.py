@@ -1,13 +1,19 @@
 """Budget repository for budget operations."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import case, func, lambda_stmt, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.budget import Budget
 
+# date_trunc unit per budget period; the next reset is the start of the
+# following period computed server-side, so the weekday/month-wrap
+# arithmetic lives in one SQL expression instead of Python branches
+_PERIOD_UNITS = {"daily": "day", "weekly": "week", "monthly": "month"}
+
 
 class BudgetRepository:
     """Repository for budget operations."""
@@ -25,9 +31,10 @@ class BudgetRepository:
         Returns:
             Budget instance or None
         """
-        result = await self.db.execute(
-            select(Budget).where(Budget.user_id == user_id)
-        )
+        # lambda_stmt caches the compiled statement; the closure variable
+        # becomes the bound parameter on each call
+        stmt = lambda_stmt(lambda: select(Budget).where(Budget.user_id == user_id))
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_or_create_budget(
@@ -47,33 +54,27 @@ class BudgetRepository:
         Returns:
             Budget instance
         """
-        budget = await self.get_user_budget(user_id)
-        if budget:
-            return budget
-
-        # Calculate reset_at based on period
-        now = datetime.utcnow()
-        if period == "daily":
-            reset_at = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        elif period == "weekly":
-            days_until_monday = (7 - now.weekday()) % 7
-            reset_at = (now + timedelta(days=days_until_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-        else:  # monthly
-            if now.month == 12:
-                reset_at = datetime(now.year + 1, 1, 1)
-            else:
-                reset_at = datetime(now.year, now.month + 1, 1)
-
-        budget = Budget(
-            user_id=user_id,
-            limit=limit,
-            period=period,
-            current_spend=0.0,
-            reset_at=reset_at,
+        # Race-free upsert: ON CONFLICT DO NOTHING means two concurrent
+        # first requests cannot both insert, and reset_at is computed
+        # server-side as the start of the next period
+        unit = _PERIOD_UNITS.get(period, "month")
+        stmt = (
+            pg_insert(Budget)
+            .values(
+                user_id=user_id,
+                limit=limit,
+                period=period,
+                current_spend=0.0,
+                reset_at=func.date_trunc(unit, func.now()) + text(f"INTERVAL '1 {unit}'"),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id"])
+            .returning(Budget)
         )
-        self.db.add(budget)
-        await self.db.flush()
-        return budget
+        budget = (await self.db.execute(stmt)).scalar_one_or_none()
+        if budget is not None:
+            return budget
+        # Conflict: another request created the row; read it back
+        return await self.get_user_budget(user_id)
 
     async def get_current_period_spend(
         self,
@@ -84,6 +85,12 @@ class BudgetRepository:
         """
         Calculate current period spend from request logs.
 
+        Reconciliation helper only: the hot path trusts the running
+        Budget.current_spend counter, which update_spend maintains
+        atomically. This aggregate scan exists to audit drift between the
+        counter and the logs (e.g. from a periodic job), not to be called
+        per request.
+
         Args:
             user_id: User ID
             start_date: Period start date
@@ -118,13 +125,21 @@ class BudgetRepository:
         Returns:
             Updated Budget instance
         """
-        budget = await self.get_user_budget(user_id)
-        if not budget:
+        # Single atomic UPDATE: one roundtrip instead of SELECT-then-flush,
+        # and the server-side increment cannot lose concurrent updates
+        stmt = (
+            update(Budget)
+            .where(Budget.user_id == user_id)
+            .values(
+                current_spend=Budget.current_spend + amount,
+                updated_at=datetime.utcnow(),
+            )
+            .returning(Budget)
+        )
+        result = await self.db.execute(stmt)
+        budget = result.scalar_one_or_none()
+        if budget is None:
             raise ValueError(f"Budget not found for user {user_id}")
-
-        budget.current_spend += amount
-        budget.updated_at = datetime.utcnow()
-        await self.db.flush()
         return budget
 
     async def reset_budget(self, user_id: UUID) -> Budget:
@@ -137,25 +152,25 @@ class BudgetRepository:
         Returns:
             Updated Budget instance
         """
-        budget = await self.get_user_budget(user_id)
-        if not budget:
+        # Single UPDATE: the CASE on period picks the next boundary
+        # server-side, so no preceding SELECT is needed
+        reset_expr = case(
+            (Budget.period == "daily", func.date_trunc("day", func.now()) + text("INTERVAL '1 day'")),
+            (Budget.period == "weekly", func.date_trunc("week", func.now()) + text("INTERVAL '1 week'")),
+            else_=func.date_trunc("month", func.now()) + text("INTERVAL '1 month'"),
+        )
+        stmt = (
+            update(Budget)
+            .where(Budget.user_id == user_id)
+            .values(
+                current_spend=0.0,
+                reset_at=reset_expr,
+                updated_at=func.now(),
+            )
+            .returning(Budget)
+        )
+        budget = (await self.db.execute(stmt)).scalar_one_or_none()
+        if budget is None:
             raise ValueError(f"Budget not found for user {user_id}")
-
-        # Calculate new reset_at
-        now = datetime.utcnow()
-        if budget.period == "daily":
-            budget.reset_at = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        elif budget.period == "weekly":
-            days_until_monday = (7 - now.weekday()) % 7
-            budget.reset_at = (now + timedelta(days=days_until_monday)).replace(hour=0, minute=0, second=0, microsecond=0)
-        else:  # monthly
-            if now.month == 12:
-                budget.reset_at = datetime(now.year + 1, 1, 1)
-            else:
-                budget.reset_at = datetime(now.year, now.month + 1, 1)
-
-        budget.current_spend = 0.0
-        budget.updated_at = datetime.utcnow()
-        await self.db.flush()
         return budget
 
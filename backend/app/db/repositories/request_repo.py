@@ -1,9 +1,9 @@
 """Request repository for database operations."""
 
 from datetime import datetime
-from typing import Optional, List
-from uuid import UUID
-from sqlalchemy import select, desc, func
+from typing import AsyncIterator, Optional, List, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import insert, lambda_stmt, select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.request_log import RequestLog
@@ -19,16 +19,33 @@ class RequestRepository:
         """
         Create a new request log entry.
 
+        The id is generated client-side so the INSERT needs no RETURNING
+        roundtrip; the returned instance is detached and carries the
+        supplied values plus the generated id.
+
         Args:
             request_data: Request data dictionary
 
         Returns:
-            Created RequestLog instance
+            Created RequestLog instance (detached)
+        """
+        request_data.setdefault("id", uuid4())
+        await self.db.execute(insert(RequestLog).values(**request_data))
+        return RequestLog(**request_data)
+
+    async def create_many(self, rows: List[dict]) -> None:
         """
-        request_log = RequestLog(**request_data)
-        self.db.add(request_log)
-        await self.db.flush()
-        return request_log
+        Insert a batch of request log rows in one executemany statement.
+
+        Rows must carry pre-generated ids; nothing is returned, so the
+        insert pipelines as a single roundtrip (insertmanyvalues).
+
+        Args:
+            rows: List of request log column dictionaries
+        """
+        if not rows:
+            return
+        await self.db.execute(insert(RequestLog), rows)
 
     async def get_by_id(self, request_id: UUID) -> Optional[RequestLog]:
         """
@@ -40,9 +57,8 @@ class RequestRepository:
         Returns:
             RequestLog instance or None
         """
-        result = await self.db.execute(
-            select(RequestLog).where(RequestLog.id == request_id)
-        )
+        stmt = lambda_stmt(lambda: select(RequestLog).where(RequestLog.id == request_id))
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_recent(
@@ -60,12 +76,13 @@ class RequestRepository:
         Returns:
             List of RequestLog instances
         """
-        result = await self.db.execute(
-            select(RequestLog)
+        stmt = lambda_stmt(
+            lambda: select(RequestLog)
             .where(RequestLog.user_id == user_id)
             .order_by(desc(RequestLog.request_timestamp))
             .limit(limit)
         )
+        result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
     async def get_by_user(
@@ -105,6 +122,93 @@ class RequestRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def stream_by_user(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        provider: Optional[str] = None,
+        batch_size: int = 200,
+    ) -> AsyncIterator[RequestLog]:
+        """
+        Stream requests for a user without materializing the full list.
+
+        Rows come off a server-side cursor in batches of ``batch_size``,
+        so exports and large windows hold at most one batch of ORM
+        objects in memory instead of the whole result. Use get_by_user
+        for small paginated reads.
+
+        Args:
+            user_id: User ID
+            start_date: Start date filter
+            end_date: End date filter
+            provider: Provider filter
+            batch_size: Rows fetched per cursor roundtrip
+
+        Yields:
+            RequestLog instances in descending timestamp order
+        """
+        query = select(RequestLog).where(RequestLog.user_id == user_id)
+
+        if start_date:
+            query = query.where(RequestLog.request_timestamp >= start_date)
+        if end_date:
+            query = query.where(RequestLog.request_timestamp <= end_date)
+        if provider:
+            query = query.where(RequestLog.provider == provider)
+
+        query = query.order_by(desc(RequestLog.request_timestamp))
+
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for request_log in result.scalars():
+            yield request_log
+
+    async def list_with_total(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        provider: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[List[RequestLog], int]:
+        """
+        Get a page of requests plus the unpaginated total in one query.
+
+        A window-function count rides along with every row, so paginated
+        listings need a single plan instead of the get_by_user +
+        count_by_user pair (two executions, two index scans).
+
+        Args:
+            user_id: User ID
+            start_date: Start date filter
+            end_date: End date filter
+            provider: Provider filter
+            limit: Maximum number of requests
+            offset: Offset for pagination
+
+        Returns:
+            Tuple of (page of RequestLog instances, total matching count)
+        """
+        query = select(RequestLog, func.count().over().label("_total")).where(
+            RequestLog.user_id == user_id
+        )
+
+        if start_date:
+            query = query.where(RequestLog.request_timestamp >= start_date)
+        if end_date:
+            query = query.where(RequestLog.request_timestamp <= end_date)
+        if provider:
+            query = query.where(RequestLog.provider == provider)
+
+        query = query.order_by(desc(RequestLog.request_timestamp)).limit(limit).offset(offset)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+        if not rows:
+            return [], 0
+        return [row[0] for row in rows], rows[0]._total
+
     async def count_by_user(
         self,
         user_id: UUID,
@@ -1,11 +1,12 @@
 """Webhook repository for webhook operations."""
 
+from datetime import datetime
 from typing import List, Optional
-from uuid import UUID
-from sqlalchemy import select, and_
+from uuid import UUID, uuid4
+from sqlalchemy import insert, lambda_stmt, select, update, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.webhook import Webhook
+from app.db.models.webhook import Webhook, WebhookSubscription
 
 
 class WebhookRepository:
@@ -22,12 +23,24 @@ class WebhookRepository:
             webhook_data: Webhook data dictionary
 
         Returns:
-            Created Webhook instance
+            Created Webhook instance (detached)
         """
-        webhook = Webhook(**webhook_data)
-        self.db.add(webhook)
-        await self.db.flush()
-        return webhook
+        # Client-side id and timestamps: the INSERT needs no RETURNING
+        # roundtrip and the detached instance is complete for responses
+        now = datetime.utcnow()
+        webhook_data.setdefault("id", uuid4())
+        webhook_data.setdefault("is_active", True)
+        webhook_data.setdefault("created_at", now)
+        webhook_data.setdefault("updated_at", now)
+        await self.db.execute(insert(Webhook).values(**webhook_data))
+        events = webhook_data.get("events") or []
+        if events:
+            # Mirror the events array into the dispatch join table
+            await self.db.execute(
+                insert(WebhookSubscription),
+                [{"webhook_id": webhook_data["id"], "event_type": e} for e in events],
+            )
+        return Webhook(**webhook_data)
 
     async def get_by_id(self, webhook_id: UUID) -> Optional[Webhook]:
         """
@@ -39,9 +52,8 @@ class WebhookRepository:
         Returns:
             Webhook instance or None
         """
-        result = await self.db.execute(
-            select(Webhook).where(Webhook.id == webhook_id)
-        )
+        stmt = lambda_stmt(lambda: select(Webhook).where(Webhook.id == webhook_id))
+        result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_user(self, user_id: UUID) -> List[Webhook]:
@@ -59,25 +71,32 @@ class WebhookRepository:
         )
         return list(result.scalars().all())
 
-    async def get_active_webhooks(self, event_type: str) -> List[Webhook]:
+    async def get_active_webhooks(self, event_type: str) -> List[dict]:
         """
-        Get active webhooks for an event type.
+        Get delivery targets for an event type.
+
+        Reads the webhook_subscriptions join table instead of probing the
+        events ARRAY, so the lookup is a primary-key index scan; only the
+        columns needed for delivery come back.
 
         Args:
             event_type: Event type to filter by
 
         Returns:
-            List of active Webhook instances
+            List of {"url", "secret"} dicts for active webhooks
         """
-        result = await self.db.execute(
-            select(Webhook).where(
+        stmt = lambda_stmt(
+            lambda: select(Webhook.url, Webhook.secret)
+            .join(WebhookSubscription, WebhookSubscription.webhook_id == Webhook.id)
+            .where(
                 and_(
+                    WebhookSubscription.event_type == event_type,
                     Webhook.is_active == True,
-                    Webhook.events.contains([event_type]),
                 )
             )
         )
-        return list(result.scalars().all())
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings()]
 
     async def update(self, webhook_id: UUID, update_data: dict) -> Optional[Webhook]:
         """
@@ -90,14 +109,29 @@ class WebhookRepository:
         Returns:
             Updated Webhook instance or None
         """
-        webhook = await self.get_by_id(webhook_id)
-        if not webhook:
-            return None
-
-        for key, value in update_data.items():
-            setattr(webhook, key, value)
-
-        await self.db.flush()
+        # Single UPDATE ... RETURNING: no preceding SELECT, no identity-map
+        # load, and only the changed columns go over the wire
+        stmt = (
+            update(Webhook)
+            .where(Webhook.id == webhook_id)
+            .values(**update_data)
+            .returning(Webhook)
+        )
+        result = await self.db.execute(stmt)
+        webhook = result.scalar_one_or_none()
+        if webhook is not None and "events" in update_data:
+            # Rebuild the dispatch join table rows for the new event list
+            await self.db.execute(
+                delete(WebhookSubscription).where(
+                    WebhookSubscription.webhook_id == webhook_id
+                )
+            )
+            events = update_data["events"] or []
+            if events:
+                await self.db.execute(
+                    insert(WebhookSubscription),
+                    [{"webhook_id": webhook_id, "event_type": e} for e in events],
+                )
         return webhook
 
     async def delete(self, webhook_id: UUID) -> bool:
@@ -110,11 +144,7 @@ class WebhookRepository:
         Returns:
             True if deleted, False if not found
         """
-        webhook = await self.get_by_id(webhook_id)
-        if not webhook:
-            return False
-
-        await self.db.delete(webhook)
-        await self.db.flush()
-        return True
+        stmt = delete(Webhook).where(Webhook.id == webhook_id).returning(Webhook.id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
 
@@ -1,9 +1,17 @@
 """Database session management."""
 
+import time
+
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.config import config_manager, settings
+from app.core.metrics import db_query_duration
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Create base class for models
 Base = declarative_base()
@@ -13,16 +21,92 @@ Base = declarative_base()
 # But actually, we want to manage transactions ourselves, so we use "READ COMMITTED"
 engine = create_async_engine(
     settings.database_url,
-    pool_size=config_manager.get("database.pool_size", 20),
-    max_overflow=config_manager.get("database.max_overflow", 10),
-    pool_timeout=config_manager.get("database.pool_timeout", 30),
+    # Sized for concurrent gateway load: the old 20+10 pool saturated
+    # quickly and a 30s pool_timeout hid it; fail fast at 10s instead
+    pool_size=config_manager.get("database.pool_size", 50),
+    max_overflow=config_manager.get("database.max_overflow", 20),
+    pool_timeout=config_manager.get("database.pool_timeout", 10),
+    # Detect connections dropped by the server/load balancer before use,
+    # and recycle well inside typical idle-timeout windows
+    pool_pre_ping=True,
+    pool_recycle=1800,
     echo=config_manager.get("database.echo", False),
+    # JSONB columns (request payloads, PII entities, guardrail details)
+    # are written on every logged request; orjson serializes them several
+    # times faster than the stdlib default
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
     # Ensure we don't have nested transaction issues
-    connect_args={"server_settings": {"jit": "off"}},
+    connect_args={
+        "server_settings": {"jit": "off", "application_name": "ai-gateway"},
+        # Per-connection prepared-statement cache: the repeated repo
+        # queries skip the Parse roundtrip after first execution
+        "prepared_statement_cache_size": 1024,
+    },
     # Use future=True for SQLAlchemy 2.0 style
     future=True,
 )
 
+# Read-replica engine for the analytics aggregate scans, so they never
+# compete with the write path for primary pool slots. Connections are
+# pinned read-only; without DATABASE_READONLY_URL this is just the
+# primary engine and behavior is unchanged.
+if settings.database_readonly_url:
+    read_engine = create_async_engine(
+        settings.database_readonly_url,
+        pool_size=config_manager.get("database.readonly_pool_size", 10),
+        max_overflow=config_manager.get("database.readonly_max_overflow", 10),
+        pool_timeout=config_manager.get("database.pool_timeout", 10),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        json_serializer=lambda value: orjson.dumps(value).decode(),
+        json_deserializer=orjson.loads,
+        connect_args={
+            "server_settings": {
+                "jit": "off",
+                "application_name": "ai-gateway-analytics",
+                "default_transaction_read_only": "on",
+            },
+            "prepared_statement_cache_size": 1024,
+        },
+        future=True,
+    )
+else:
+    read_engine = engine
+
+
+# Statement timing: every cursor execution is observed in a Prometheus
+# histogram (labelled by the leading SQL keyword, so cardinality stays
+# bounded) and anything slower than database.slow_query_ms is logged with
+# a truncated statement. Complements pg_stat_statements on the server
+# side (see /admin/db/slow).
+_SLOW_QUERY_SECONDS = config_manager.get("database.slow_query_ms", 500) / 1000.0
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    operation = statement.split(None, 1)[0].upper() if statement else "OTHER"
+    db_query_duration.labels(operation=operation).observe(elapsed)
+    if elapsed >= _SLOW_QUERY_SECONDS:
+        logger.warning(
+            f"Slow query ({elapsed * 1000:.1f}ms): {statement[:200]}"
+        )
+
+
+if read_engine is not engine:
+    event.listens_for(read_engine.sync_engine, "before_cursor_execute")(_before_cursor_execute)
+    event.listens_for(read_engine.sync_engine, "after_cursor_execute")(_after_cursor_execute)
+
+
 # Create async session maker
 # Use autocommit=False to avoid nested transaction issues
 # Note: autocommit parameter doesn't exist in async_sessionmaker
@@ -33,24 +117,13 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Sessions bound to the read replica (or the primary when no replica is
+# configured); used by the analytics read path
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
 
-async def get_db() -> AsyncSession:
-    """
-    Dependency for getting database session.
-
-    Yields:
-        Database session
-    """
-    # Create session without auto-commit
-    # Transaction will be managed by the endpoint
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            # Only commit if no exception occurred
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
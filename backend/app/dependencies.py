@@ -1,15 +1,30 @@
 """FastAPI dependencies."""
 
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as aioredis
 
-from app.db.session import AsyncSessionLocal
-from app.config import settings
+from app.db.session import AsyncSessionLocal, AsyncReadSessionLocal
+from app.config import config_manager, settings
 from app.core.security import verify_api_key_dependency, verify_admin_key
 from app.db.models.user import User
 
+# Shared connection pool: per-request get_redis calls hand out clients
+# backed by the same pool instead of opening a fresh TCP connection each
+# time. Closed alongside the other Redis clients in lifespan shutdown.
+_redis_pool = aioredis.ConnectionPool.from_url(
+    settings.redis_url,
+    decode_responses=False,
+    max_connections=config_manager.get("redis.pool_size", 50),
+)
+
+
+async def close_redis_pool() -> None:
+    """Disconnect the shared Redis pool (called on shutdown)."""
+    await _redis_pool.disconnect()
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -18,18 +33,43 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         Database session
     """
-    # Create session without auto-commit
-    # Transaction will be managed by the endpoint
+    # session.begin() gives exactly the old hand-rolled semantics:
+    # commit on clean exit, rollback on exception, close either way
+    async with AsyncSessionLocal() as session, session.begin():
+        yield session
+
+
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Read-replica database session dependency.
+
+    Analytics scans go through here so they never hold primary pool
+    slots; without DATABASE_READONLY_URL this is the primary engine.
+
+    Yields:
+        Database session bound to the read engine
+    """
+    async with AsyncReadSessionLocal() as session, session.begin():
+        yield session
+
+
+@asynccontextmanager
+async def get_db_short() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Call-scoped database session for long-lived connections.
+
+    Streaming/WebSocket handlers hold their HTTP connection open for many
+    seconds; a request-scoped session would pin a pool slot the whole
+    time. Wrap each individual DB interaction instead:
+
+        async with get_db_short() as session:
+            ...
+
+    The transaction commits on clean exit and rolls back on exception.
+    """
     async with AsyncSessionLocal() as session:
-        try:
+        async with session.begin():
             yield session
-            # Only commit if no exception occurred
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
 
 async def get_redis() -> aioredis.Redis:
@@ -39,10 +79,7 @@ async def get_redis() -> aioredis.Redis:
     Returns:
         Redis client
     """
-    return await aioredis.from_url(
-        settings.redis_url,
-        decode_responses=False,
-    )
+    return aioredis.Redis(connection_pool=_redis_pool)
 
 
 async def get_current_user(
@@ -1,19 +1,51 @@
 """Google Gemini embedding provider."""
 
+import asyncio
 from typing import List
 import numpy as np
 import google.generativeai as genai
 
 from app.config import config_manager, settings
 from app.embeddings.base import BaseEmbeddingProvider, EmbeddingResponse
+from app.utils.decorators import async_retry
+
+# Configure the SDK's global state once at import instead of on every
+# provider construction
+genai.configure(api_key=settings.gemini_api_key)
 
 
 class GeminiEmbeddingProvider(BaseEmbeddingProvider):
     """Google Gemini embedding provider."""
 
     def __init__(self):
-        genai.configure(api_key=settings.gemini_api_key)
         self.model = "embedding-001"
+        # Bounds concurrent embed_content calls so batch ingest does not
+        # trip provider rate limits
+        self._sem = asyncio.Semaphore(
+            config_manager.get("embeddings.gemini_concurrency", 16)
+        )
+
+    @async_retry(max_retries=3, delay=1.0)
+    async def _embed_one(self, text: str) -> EmbeddingResponse:
+        """Embed a single text off the event loop, with per-item retry."""
+        # genai.embed_content is blocking; run it in a thread so
+        # concurrent calls overlap on the network instead of serializing
+        async with self._sem:
+            result = await asyncio.to_thread(
+                genai.embed_content,
+                model=self.model,
+                content=text,
+                task_type="retrieval_document",
+            )
+
+        embedding_array = np.array(result["embedding"], dtype=np.float32)
+
+        return EmbeddingResponse(
+            embedding=embedding_array,
+            dimensions=len(embedding_array),
+            model=self.model,
+            tokens=0,  # Gemini may not provide token count
+        )
 
     async def embed(self, text: str) -> EmbeddingResponse:
         """
@@ -25,48 +57,20 @@ class GeminiEmbeddingProvider(BaseEmbeddingProvider):
         Returns:
             EmbeddingResponse
         """
-        # Note: Gemini embedding API may have different interface
-        # This is a placeholder implementation
-        result = genai.embed_content(
-            model=self.model,
-            content=text,
-            task_type="retrieval_document",
-        )
-
-        embedding_array = np.array(result["embedding"], dtype=np.float32)
-
-        return EmbeddingResponse(
-            embedding=embedding_array,
-            dimensions=len(embedding_array),
-            model=self.model,
-            tokens=0,  # Gemini may not provide token count
-        )
+        return await self._embed_one(text)
 
     async def embed_batch(self, texts: List[str]) -> List[EmbeddingResponse]:
         """
-        Generate embeddings for multiple texts.
+        Generate embeddings for multiple texts concurrently.
+
+        Wall time for K texts is bounded by the semaphore width rather
+        than K serial round-trips; per-item retries keep a single 429
+        from failing the whole batch.
 
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of EmbeddingResponse instances
+            List of EmbeddingResponse instances, in input order
         """
-        results = []
-        for text in texts:
-            result = genai.embed_content(
-                model=self.model,
-                content=text,
-                task_type="retrieval_document",
-            )
-            embedding_array = np.array(result["embedding"], dtype=np.float32)
-            results.append(
-                EmbeddingResponse(
-                    embedding=embedding_array,
-                    dimensions=len(embedding_array),
-                    model=self.model,
-                    tokens=0,
-                )
-            )
-        return results
-
+        return list(await asyncio.gather(*(self._embed_one(t) for t in texts)))
@@ -1,19 +1,42 @@
 """OpenAI embedding provider."""
 
+import asyncio
+import base64
 from typing import List
 import numpy as np
 from openai import AsyncOpenAI
 
 from app.config import config_manager, settings
+from app.core.http import shared_async_client
 from app.embeddings.base import BaseEmbeddingProvider, EmbeddingResponse
 
+# text-embedding-3-* accepts at most 2048 inputs per request; batches
+# above that would 4xx, and splitting also lets sub-batches overlap on
+# the network
+MAX_BATCH = 2048
+# Default concurrent in-flight embedding requests (tier-1 rate limits)
+MAX_CONCURRENCY = 35
+
 
 class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
     """OpenAI embedding provider."""
 
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=shared_async_client,
+        )
         self.model = config_manager.get("cache.embedding_model", "text-embedding-3-small")
+        self._sem = asyncio.Semaphore(
+            config_manager.get("embeddings.openai_concurrency", MAX_CONCURRENCY)
+        )
+
+    @staticmethod
+    def _decode_embedding(data) -> np.ndarray:
+        """Decode a base64 float32 vector; pass through list responses."""
+        if isinstance(data, str):
+            return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+        return np.array(data, dtype=np.float32)
 
     async def embed(self, text: str) -> EmbeddingResponse:
         """
@@ -25,13 +48,16 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
         Returns:
             EmbeddingResponse
         """
+        # base64 vectors decode via np.frombuffer in one C call instead
+        # of iterating ~1536 Python floats per embedding
         response = await self.client.embeddings.create(
             model=self.model,
             input=text,
+            encoding_format="base64",
         )
 
         embedding_data = response.data[0]
-        embedding_array = np.array(embedding_data.embedding, dtype=np.float32)
+        embedding_array = self._decode_embedding(embedding_data.embedding)
 
         return EmbeddingResponse(
             embedding=embedding_array,
@@ -40,32 +66,62 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
             tokens=embedding_data.usage.total_tokens if hasattr(embedding_data, "usage") else 0,
         )
 
+    async def _embed_sub_batch(self, texts: List[str]) -> List[EmbeddingResponse]:
+        """Embed one provider-sized sub-batch under the concurrency cap."""
+        async with self._sem:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=texts,
+                encoding_format="base64",
+            )
+
+        if not response.data:
+            return []
+
+        # One contiguous (K, D) matrix instead of K scattered allocations;
+        # each response holds a row view, so callers must not mutate
+        first = self._decode_embedding(response.data[0].embedding)
+        out = np.empty((len(response.data), len(first)), dtype=np.float32)
+        out[0] = first
+        for i, embedding_data in enumerate(response.data[1:], start=1):
+            out[i] = self._decode_embedding(embedding_data.embedding)
+
+        return [
+            EmbeddingResponse(
+                embedding=out[i],
+                dimensions=out.shape[1],
+                model=self.model,
+                tokens=embedding_data.usage.total_tokens if hasattr(embedding_data, "usage") else 0,
+            )
+            for i, embedding_data in enumerate(response.data)
+        ]
+
     async def embed_batch(self, texts: List[str]) -> List[EmbeddingResponse]:
         """
         Generate embeddings for multiple texts.
 
+        Large inputs are split into provider-sized sub-batches sent
+        concurrently; texts are grouped longest-first so sub-batch token
+        counts stay balanced, then results are restored to input order.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of EmbeddingResponse instances
+            List of EmbeddingResponse instances, in input order
         """
-        response = await self.client.embeddings.create(
-            model=self.model,
-            input=texts,
-        )
-
-        results = []
-        for i, embedding_data in enumerate(response.data):
-            embedding_array = np.array(embedding_data.embedding, dtype=np.float32)
-            results.append(
-                EmbeddingResponse(
-                    embedding=embedding_array,
-                    dimensions=len(embedding_array),
-                    model=self.model,
-                    tokens=embedding_data.usage.total_tokens if hasattr(embedding_data, "usage") else 0,
-                )
-            )
-
+        if len(texts) <= MAX_BATCH:
+            return await self._embed_sub_batch(texts)
+
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        sublists = [
+            [texts[i] for i in order[start:start + MAX_BATCH]]
+            for start in range(0, len(order), MAX_BATCH)
+        ]
+        chunks = await asyncio.gather(*(self._embed_sub_batch(sub) for sub in sublists))
+
+        results: List[EmbeddingResponse] = [None] * len(texts)  # type: ignore[list-item]
+        flat = (item for chunk in chunks for item in chunk)
+        for idx, item in zip(order, flat):
+            results[idx] = item
         return results
-
@@ -5,11 +5,18 @@ from dataclasses import dataclass
 
 from app.config import config_manager
 from app.pii.entities import PIIEntity
-from app.guardrails.rules import BaseRule, GuardrailViolation, MaxTokensRule, NoPIIRule, ContentFilterRule
+from app.guardrails.rules import (
+    BaseRule,
+    GuardrailViolation,
+    MaxTokensRule,
+    NoPIIRule,
+    ContentFilterRule,
+    MaxCostRule,
+)
 from app.guardrails.custom import custom_rule_loader
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardrailResult:
     """Guardrail check result."""
 
@@ -18,6 +25,10 @@ class GuardrailResult:
     should_block: bool
 
 
+# Shared constant returned by the disabled fast path; callers only read it
+_EMPTY_RESULT = GuardrailResult(passed=True, violations=[], should_block=False)
+
+
 class GuardrailEngine:
     """Engine for running guardrail checks."""
 
@@ -25,6 +36,7 @@ class GuardrailEngine:
         self._enabled = config_manager.get("guardrails.enabled", True)
         self._block_on_violation = config_manager.get("guardrails.block_on_violation", True)
         self._rules: List[BaseRule] = []
+        self._rules_payload: Optional[List[Dict[str, Any]]] = None
         self._load_rules()
 
     def _load_rules(self):
@@ -41,6 +53,70 @@ class GuardrailEngine:
         custom_rules = custom_rule_loader.load_rules()
         self._rules.extend(custom_rules)
 
+        # Rules change only on reload; invalidate the serialized listing
+        self._rules_payload = None
+        self._partition_rules()
+        self._update_fast_path()
+
+    def _update_fast_path(self):
+        """Bind check to a constant-return stub when no rule can ever run.
+
+        With guardrails disabled (or no rules loaded) the per-request
+        call becomes a single bound-method return of a shared result
+        instead of walking buckets behind an enabled branch.
+        """
+        if not self._enabled or not self._rules:
+            self.check = self._check_disabled
+        else:
+            self.__dict__.pop("check", None)
+
+    def _check_disabled(self, *args, **kwargs) -> GuardrailResult:
+        return _EMPTY_RESULT
+
+    def _partition_rules(self):
+        """Bucket enabled rules by the input they consume.
+
+        check() then only walks the buckets whose input is present, so a
+        token-only check never touches PII/content/cost rules. Within a
+        bucket, error-severity rules run first so blocking violations
+        surface before warnings.
+        """
+        self._token_rules: List[BaseRule] = []
+        self._pii_rules: List[BaseRule] = []
+        self._content_rules: List[BaseRule] = []
+        self._cost_rules: List[BaseRule] = []
+        # Rules of unknown classes (custom BaseRule subclasses) always run
+        self._general_rules: List[BaseRule] = []
+
+        buckets = {
+            MaxTokensRule: self._token_rules,
+            NoPIIRule: self._pii_rules,
+            ContentFilterRule: self._content_rules,
+            MaxCostRule: self._cost_rules,
+        }
+        for rule in self._rules:
+            if not rule.enabled:
+                continue
+            buckets.get(type(rule), self._general_rules).append(rule)
+
+        for bucket in buckets.values():
+            bucket.sort(key=lambda r: r.severity != "error")
+
+    def list_rules(self) -> List[Dict[str, Any]]:
+        """Get a serializable listing of loaded rules (cached)."""
+        if self._rules_payload is None:
+            self._rules_payload = [
+                {
+                    "name": rule.name,
+                    "type": rule.rule_type,
+                    "enabled": rule.enabled,
+                    "severity": rule.severity,
+                    "action": rule.action,
+                }
+                for rule in self._rules
+            ]
+        return self._rules_payload
+
     def _create_builtin_rule(self, config: Dict[str, Any]) -> Optional[BaseRule]:
         """Create built-in rule from config."""
         rule_type = config.get("type", "")
@@ -102,22 +178,34 @@ class GuardrailEngine:
         violations = []
         should_block = False
 
-        for rule in self._rules:
-            if not rule.enabled:
-                continue
-
-            violation = rule.check(
-                text=text,
-                pii_entities=pii_entities,
-                tokens=tokens,
-                cost=cost,
-                **kwargs,
-            )
-
-            if violation:
-                violations.append(violation)
-                if violation.severity == "error" and self._block_on_violation:
-                    should_block = True
+        # Only walk buckets whose input is present; absent inputs would
+        # make every rule in the bucket a no-op anyway
+        active_buckets = []
+        if tokens is not None:
+            active_buckets.append(self._token_rules)
+        if pii_entities:
+            active_buckets.append(self._pii_rules)
+        if text:
+            active_buckets.append(self._content_rules)
+        if cost is not None:
+            active_buckets.append(self._cost_rules)
+        if self._general_rules:
+            active_buckets.append(self._general_rules)
+
+        for bucket in active_buckets:
+            for rule in bucket:
+                violation = rule.check(
+                    text=text,
+                    pii_entities=pii_entities,
+                    tokens=tokens,
+                    cost=cost,
+                    **kwargs,
+                )
+
+                if violation:
+                    violations.append(violation)
+                    if violation.severity == "error" and self._block_on_violation:
+                        should_block = True
 
         passed = len(violations) == 0
         return GuardrailResult(
@@ -1,12 +1,13 @@
 """Built-in guardrail rules."""
 
+import re
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from app.pii.entities import PIIEntity
-from app.guardrails.validators import validate_content, validate_pii, validate_threshold
+from app.guardrails.validators import validate_pii, validate_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardrailViolation:
     """Guardrail violation."""
 
@@ -85,6 +86,8 @@ class NoPIIRule(BaseRule):
     def __init__(self, entity_types: List[str] = None, **kwargs):
         super().__init__(**kwargs)
         self.entity_types = entity_types or []
+        # O(1) membership check for the per-entity filter
+        self._entity_type_set = frozenset(self.entity_types)
 
     def check(
         self,
@@ -97,16 +100,29 @@ class NoPIIRule(BaseRule):
             return None
 
         if pii_entities:
-            filtered = [
-                e for e in pii_entities
-                if not self.entity_types or e.type.value in self.entity_types
-            ]
+            type_set = self._entity_type_set
+            if type_set:
+                # Cheap any() probe first; the filtered list is only
+                # materialized once a violation is certain
+                if not any(e.type.value in type_set for e in pii_entities):
+                    return None
+                filtered = [e for e in pii_entities if e.type.value in type_set]
+            else:
+                filtered = pii_entities
             if filtered:
+                types = [e.type.value for e in filtered]
+                # Full entity dumps only for blocking violations; routine
+                # warnings get a cheap count/type summary, which is what
+                # most requests hit on a PII gateway
+                if self.severity == "error":
+                    details = {"entities": [e.to_dict() for e in filtered]}
+                else:
+                    details = {"count": len(filtered), "types": types}
                 return GuardrailViolation(
                     rule_name=self.name,
                     severity=self.severity,
-                    message=f"PII detected: {[e.type.value for e in filtered]}",
-                    details={"entities": [e.to_dict() for e in filtered]},
+                    message=f"PII detected: {types}",
+                    details=details,
                 )
         return None
 
@@ -117,13 +133,20 @@ class ContentFilterRule(BaseRule):
     def __init__(self, patterns: List[str], **kwargs):
         super().__init__(**kwargs)
         self.patterns = patterns
+        # One precompiled alternation: the text is scanned once per check
+        # instead of once per pattern
+        self._compiled = (
+            re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+            if patterns
+            else None
+        )
 
     def check(self, text: Optional[str] = None, **kwargs) -> Optional[GuardrailViolation]:
         """Check content patterns."""
-        if not self.enabled or not text:
+        if not self.enabled or not text or self._compiled is None:
             return None
 
-        if validate_content(text, self.patterns):
+        if self._compiled.search(text):
             return GuardrailViolation(
                 rule_name=self.name,
                 severity=self.severity,
@@ -1,5 +1,7 @@
 """Guardrail validators."""
 
+import operator
+import re
 from typing import List, Dict, Any
 from app.pii.entities import PIIType, PIIEntity
 
@@ -15,9 +17,9 @@ def validate_content(text: str, patterns: List[str]) -> bool:
     Returns:
         True if any pattern matches, False otherwise
     """
-    import re
+    search = re.search
     for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+        if search(pattern, text, re.IGNORECASE):
             return True
     return False
 
@@ -44,6 +46,17 @@ def validate_pii(
     return len(entities) >= threshold
 
 
+# Comparison dispatch table: one dict lookup to a C-level operator
+# instead of a string if/elif chain per call
+_OPS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "eq": operator.eq,
+}
+
+
 def validate_threshold(value: float, threshold: float, comparison: str = "gt") -> bool:
     """
     Validate threshold.
@@ -56,15 +69,8 @@ def validate_threshold(value: float, threshold: float, comparison: str = "gt") -
     Returns:
         True if condition met, False otherwise
     """
-    if comparison == "gt":
-        return value > threshold
-    elif comparison == "gte":
-        return value >= threshold
-    elif comparison == "lt":
-        return value < threshold
-    elif comparison == "lte":
-        return value <= threshold
-    elif comparison == "eq":
-        return value == threshold
-    return False
+    op = _OPS.get(comparison)
+    if op is None:
+        return False
+    return op(value, threshold)
 
@@ -1,11 +1,24 @@
 """PII detector with fast and detailed modes."""
 
 import time
-from typing import List
+from bisect import bisect_left
+from typing import Dict, List
+
+import numpy as np
 from app.pii.entities import PIIDetectionResult, PIIEntity, PIIType
 from app.pii.patterns import detect_patterns
 from app.pii.nlp_models import nlp_models
 
+# spaCy NER label -> PII type (labels without a mapping are ignored)
+_ENTITY_TYPE_MAP = {
+    "PERSON": PIIType.PERSON,
+    "ORG": PIIType.ORGANIZATION,
+    "GPE": PIIType.LOCATION,
+    "LOC": PIIType.LOCATION,
+    "MONEY": PIIType.AMOUNT,
+    "DATE": PIIType.DATE,
+}
+
 
 class PIIDetector:
     """PII detector with fast and detailed modes."""
@@ -39,6 +52,51 @@ class PIIDetector:
             processing_time_ms=processing_time,
         )
 
+    def detect_many(self, texts: List[str], mode: str = "fast") -> List[PIIDetectionResult]:
+        """
+        Detect PII in multiple texts.
+
+        In detailed mode, texts are grouped by language and each spaCy
+        model processes its group through one nlp.pipe() batch, instead
+        of paying per-doc pipeline setup once per text.
+
+        Args:
+            texts: Texts to analyze
+            mode: Detection mode ("fast" or "detailed")
+
+        Returns:
+            List of PIIDetectionResult, one per input text
+        """
+        if mode == "fast" or not texts:
+            return [self.detect(t, mode) for t in texts]
+
+        start_time = time.time()
+
+        groups: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            groups.setdefault(self.nlp_models.detect_language(text), []).append(i)
+
+        entities_by_index: List[List[PIIEntity]] = [[] for _ in texts]
+        for language, indices in groups.items():
+            if language == "tr":
+                nlp = self.nlp_models.get_turkish_model()
+            else:
+                nlp = self.nlp_models.get_english_model()
+            docs = nlp.pipe([texts[i] for i in indices], batch_size=64)
+            for i, doc in zip(indices, docs):
+                entities_by_index[i] = self._combine(texts[i], doc)
+
+        processing_time = (time.time() - start_time) * 1000
+
+        return [
+            PIIDetectionResult(
+                entities=entities,
+                mode=mode,
+                processing_time_ms=processing_time,
+            )
+            for entities in entities_by_index
+        ]
+
     def _detect_detailed(self, text: str) -> List[PIIEntity]:
         """
         Detailed detection using regex + spaCy NER.
@@ -49,9 +107,6 @@ class PIIDetector:
         Returns:
             List of detected PII entities
         """
-        # Start with pattern-based detection
-        entities = detect_patterns(text)
-
         # Detect language
         language = self.nlp_models.detect_language(text)
 
@@ -61,38 +116,58 @@ class PIIDetector:
         else:
             nlp = self.nlp_models.get_english_model()
 
-        # Run NER
-        doc = nlp(text)
+        return self._combine(text, nlp(text))
+
+    def _combine(self, text: str, doc) -> List[PIIEntity]:
+        """
+        Merge pattern-based detection with NER entities from a spaCy doc.
+
+        Args:
+            text: Source text
+            doc: spaCy Doc with entities
 
-        # Map spaCy entities to PII types
-        entity_type_map = {
-            "PERSON": PIIType.PERSON,
-            "ORG": PIIType.ORGANIZATION,
-            "GPE": PIIType.LOCATION,
-            "LOC": PIIType.LOCATION,
-            "MONEY": PIIType.AMOUNT,
-            "DATE": PIIType.DATE,
-        }
+        Returns:
+            List of detected PII entities
+        """
+        # Start with pattern-based detection
+        entities = detect_patterns(text)
 
-        # Extract NER entities
+        # Sort pattern entities once so each NER span can binary-search
+        # its overlap candidates instead of scanning the whole list
+        entities.sort(key=lambda e: e.start)
+        starts = [e.start for e in entities]
+        # Running max of ends: the backward candidate scan stops as soon
+        # as no earlier pattern entity can still reach the NER span
+        max_ends = []
+        running_end = 0
+        for e in entities:
+            running_end = max(running_end, e.end)
+            max_ends.append(running_end)
+
+        # Extract NER entities (spaCy spans never overlap each other, so
+        # only pattern entities need checking)
+        ner_entities = []
         for ent in doc.ents:
-            pii_type = entity_type_map.get(ent.label_)
+            pii_type = _ENTITY_TYPE_MAP.get(ent.label_)
             if pii_type:
                 # Check if entity overlaps with existing pattern-based entity
                 overlaps = False
-                for existing in entities:
+                j = bisect_left(starts, ent.end_char) - 1
+                while j >= 0 and max_ends[j] > ent.start_char:
+                    existing = entities[j]
                     if (
                         existing.start <= ent.start_char < existing.end
                         or existing.start < ent.end_char <= existing.end
                     ):
                         overlaps = True
                         break
+                    j -= 1
 
                 if not overlaps:
                     # Calculate confidence (simple heuristic)
                     confidence = 0.8 if ent.label_ in ["PERSON", "ORG"] else 0.9
 
-                    entities.append(
+                    ner_entities.append(
                         PIIEntity(
                             type=pii_type,
                             text=ent.text,
@@ -102,25 +177,48 @@ class PIIDetector:
                         )
                     )
 
-        # Sort by start position
-        entities.sort(key=lambda e: e.start)
+        entities.extend(ner_entities)
 
-        # Merge overlapping entities (keep higher confidence)
-        merged = []
-        for entity in entities:
-            if not merged:
-                merged.append(entity)
-                continue
-
-            last = merged[-1]
-            if entity.start < last.end:
-                # Overlap: keep entity with higher confidence
-                if entity.confidence > last.confidence:
-                    merged[-1] = entity
-            else:
-                merged.append(entity)
+        return self._merge_overlapping(entities)
+
+    @staticmethod
+    def _merge_overlapping(entities: List[PIIEntity]) -> List[PIIEntity]:
+        """
+        Merge overlapping entities, keeping the highest confidence per cluster.
+
+        Vectorized interval arithmetic over struct-of-arrays data: after
+        sorting by start, a new cluster begins wherever a start clears
+        the running max of preceding ends, and argmax over confidence
+        picks each cluster's survivor without a Python-level sweep.
+
+        Args:
+            entities: Candidate entities in any order
 
-        return merged
+        Returns:
+            Merged entities sorted by start position
+        """
+        if len(entities) < 2:
+            return entities
+
+        arr = np.empty(
+            len(entities),
+            dtype=[("s", "i4"), ("e", "i4"), ("c", "f4"), ("i", "i4")],
+        )
+        arr["s"] = [e.start for e in entities]
+        arr["e"] = [e.end for e in entities]
+        arr["c"] = [e.confidence for e in entities]
+        arr["i"] = np.arange(len(entities))
+        arr.sort(order="s")
+
+        new_cluster = np.empty(len(arr), dtype=bool)
+        new_cluster[0] = True
+        new_cluster[1:] = arr["s"][1:] >= np.maximum.accumulate(arr["e"])[:-1]
+
+        bounds = np.append(np.flatnonzero(new_cluster), len(arr))
+        return [
+            entities[int(arr["i"][lo + int(np.argmax(arr["c"][lo:hi]))])]
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
 
 
 # Singleton instance
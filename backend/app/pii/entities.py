@@ -21,7 +21,7 @@ class PIIType(str, Enum):
     DATE = "DATE"
 
 
-@dataclass
+@dataclass(slots=True)
 class PIIEntity:
     """PII entity detected in text."""
 
@@ -42,7 +42,7 @@ class PIIEntity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PIIDetectionResult:
     """Result of PII detection."""
 
@@ -2,10 +2,9 @@
 
 import re
 import secrets
-import asyncio
 from typing import Dict, Optional
+import msgpack
 import redis.asyncio as aioredis
-import json
 
 from app.config import config_manager, settings
 from app.pii.entities import PIIEntity
@@ -16,14 +15,15 @@ class PIIMasker:
 
     def __init__(self):
         self.redis: Optional[aioredis.Redis] = None
-        self._lock = asyncio.Lock()
         self._ttl = config_manager.get("pii.masking.session_ttl", 3600)
 
     async def initialize(self):
         """Initialize Redis connection."""
+        # Mask mappings are stored as msgpack bytes, so the client must
+        # not decode responses
         self.redis = await aioredis.from_url(
             settings.redis_url,
-            decode_responses=True,
+            decode_responses=False,
         )
 
     async def close(self):
@@ -49,35 +49,37 @@ class PIIMasker:
         if not entities:
             return text, ""
 
-        async with self._lock:
-            session_id = self._generate_session_id()
-            mapping: Dict[str, str] = {}
-
-            # Sort entities by start position (reverse to maintain indices)
-            sorted_entities = sorted(entities, key=lambda e: e.start, reverse=True)
-
-            masked_text = text
-            for idx, entity in enumerate(sorted_entities):
-                entity_id = f"{entity.type.value}_{idx}"
-                mask = f"<{entity.type.value}:{session_id}:{entity_id}>"
-                
-                # Replace in text
-                masked_text = (
-                    masked_text[:entity.start] + mask + masked_text[entity.end:]
-                )
-                
-                # Store mapping
-                mapping[entity_id] = entity.text
-
-            # Store mapping in Redis
-            if self.redis:
-                await self.redis.setex(
-                    f"mask:{session_id}",
-                    self._ttl,
-                    json.dumps(mapping),
-                )
-
-            return masked_text, session_id
+        # No lock needed: session ids are unique per call, so concurrent
+        # masks never touch the same Redis key
+        session_id = self._generate_session_id()
+        mapping: Dict[str, str] = {}
+
+        # Single forward pass: collect untouched slices and mask tokens,
+        # then join once, instead of recopying the whole string per entity
+        parts = []
+        cursor = 0
+        for idx, entity in enumerate(sorted(entities, key=lambda e: e.start)):
+            entity_id = f"{entity.type.value}_{idx}"
+
+            parts.append(text[cursor:entity.start])
+            parts.append(f"<{entity.type.value}:{session_id}:{entity_id}>")
+            cursor = entity.end
+
+            # Store mapping
+            mapping[entity_id] = entity.text
+
+        parts.append(text[cursor:])
+        masked_text = "".join(parts)
+
+        # Store mapping in Redis
+        if self.redis:
+            await self.redis.setex(
+                f"mask:{session_id}",
+                self._ttl,
+                msgpack.packb(mapping, use_bin_type=True),
+            )
+
+        return masked_text, session_id
 
     async def unmask(self, text: str, session_id: str) -> str:
         """
@@ -93,32 +95,27 @@ class PIIMasker:
         if not session_id or not self.redis:
             return text
 
-        async with self._lock:
-            # Retrieve mapping from Redis
-            mapping_data = await self.redis.get(f"mask:{session_id}")
-            if not mapping_data:
-                return text  # Mapping expired or not found
-
-            mapping = json.loads(mapping_data)
+        # GETDEL fetches and removes the one-shot mapping in a single
+        # round-trip instead of a GET followed by a DELETE
+        mapping_data = await self.redis.getdel(f"mask:{session_id}")
+        if not mapping_data:
+            return text  # Mapping expired or not found
 
-            # Find all masked patterns
-            pattern = re.compile(
-                rf"<([A-Z_]+):{re.escape(session_id)}:([A-Z_]+_\d+)>"
-            )
-
-            def replace_match(match):
-                entity_type = match.group(1)
-                entity_id = match.group(2)
-                if entity_id in mapping:
-                    return mapping[entity_id]
-                return match.group(0)  # Return original if not found
+        mapping = msgpack.unpackb(mapping_data, raw=False)
 
-            unmasked_text = pattern.sub(replace_match, text)
+        # Find all masked patterns
+        pattern = re.compile(
+            rf"<([A-Z_]+):{re.escape(session_id)}:([A-Z_]+_\d+)>"
+        )
 
-            # Delete mapping after unmasking
-            await self.redis.delete(f"mask:{session_id}")
+        def replace_match(match):
+            entity_type = match.group(1)
+            entity_id = match.group(2)
+            if entity_id in mapping:
+                return mapping[entity_id]
+            return match.group(0)  # Return original if not found
 
-            return unmasked_text
+        return pattern.sub(replace_match, text)
 
 
 # Singleton instance
@@ -1,9 +1,27 @@
 """spaCy NLP models singleton."""
 
+from functools import lru_cache
 from typing import Optional
 import spacy
 from spacy.language import Language
 
+_TURKISH_CHARS = frozenset("çğıöşüÇĞIİÖŞÜ")
+
+
+@lru_cache(maxsize=1024)
+def _detect_language_cached(text: str) -> str:
+    """Language heuristic with a bounded cache.
+
+    The same text is commonly scanned more than once per request
+    (prompt PII check, then masking); repeat lookups return without
+    rescanning the string.
+    """
+    # Simple heuristic: isdisjoint makes one C-level pass over the text
+    # and stops at the first Turkish character
+    if not _TURKISH_CHARS.isdisjoint(text):
+        return "tr"
+    return "en"
+
 
 class NLPModels:
     """Singleton for managing spaCy models."""
@@ -65,11 +83,7 @@ class NLPModels:
         Returns:
             Language code ("tr" or "en")
         """
-        # Simple heuristic: check for Turkish characters
-        turkish_chars = "çğıöşüÇĞIİÖŞÜ"
-        if any(char in text for char in turkish_chars):
-            return "tr"
-        return "en"
+        return _detect_language_cached(text)
 
 
 # Singleton instance
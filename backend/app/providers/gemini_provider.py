@@ -7,15 +7,47 @@ from app.config import config_manager, settings
 from app.providers.base import BaseProvider, ProviderResponse
 from app.core.exceptions import ProviderException
 
+# Configure the SDK's global state once at import instead of on every
+# provider construction
+genai.configure(api_key=settings.gemini_api_key)
+
 
 class GeminiProvider(BaseProvider):
     """Google Gemini provider."""
 
     def __init__(self):
         super().__init__("gemini")
-        genai.configure(api_key=settings.gemini_api_key)
         self.pricing = config_manager.get("providers.gemini.pricing", {})
         self.max_retries = config_manager.get("providers.gemini.max_retries", 3)
+        # GenerativeModel instances per model name: construction copies
+        # SDK config, so build each once and reuse across requests
+        self._models: Dict[str, genai.GenerativeModel] = {}
+
+    def _get_model(self, model: str) -> genai.GenerativeModel:
+        """Get the GenerativeModel for a model name, caching per name."""
+        instance = self._models.get(model)
+        if instance is None:
+            instance = genai.GenerativeModel(model)
+            self._models[model] = instance
+        return instance
+
+    @staticmethod
+    def _convert_messages(messages: List[Dict[str, str]]) -> List[Dict]:
+        """Convert OpenAI-style messages to the Gemini contents format."""
+        gemini_messages = []
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if role == "system":
+                # Gemini doesn't have system messages, prepend to first user message
+                if gemini_messages:
+                    gemini_messages[-1] += f"\n{content}"
+                else:
+                    gemini_messages.append({"role": "user", "parts": [content]})
+            else:
+                gemini_role = "user" if role == "user" else "model"
+                gemini_messages.append({"role": gemini_role, "parts": [content]})
+        return gemini_messages
 
     async def complete(
         self,
@@ -26,20 +58,7 @@ class GeminiProvider(BaseProvider):
     ) -> ProviderResponse:
         """Complete chat completion."""
         try:
-            # Convert messages format for Gemini
-            gemini_messages = []
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if role == "system":
-                    # Gemini doesn't have system messages, prepend to first user message
-                    if gemini_messages:
-                        gemini_messages[-1] += f"\n{content}"
-                    else:
-                        gemini_messages.append({"role": "user", "parts": [content]})
-                else:
-                    gemini_role = "user" if role == "user" else "model"
-                    gemini_messages.append({"role": gemini_role, "parts": [content]})
+            gemini_messages = self._convert_messages(messages)
 
             # Configure generation
             generation_config = {}
@@ -48,9 +67,7 @@ class GeminiProvider(BaseProvider):
             if temperature:
                 generation_config["temperature"] = temperature
 
-            # Create model and generate
-            model_instance = genai.GenerativeModel(model)
-            response = await model_instance.generate_content_async(
+            response = await self._get_model(model).generate_content_async(
                 gemini_messages,
                 generation_config=generation_config,
             )
@@ -88,19 +105,7 @@ class GeminiProvider(BaseProvider):
     ) -> AsyncGenerator[str, None]:
         """Stream chat completion."""
         try:
-            # Convert messages format for Gemini
-            gemini_messages = []
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                if role == "system":
-                    if gemini_messages:
-                        gemini_messages[-1] += f"\n{content}"
-                    else:
-                        gemini_messages.append({"role": "user", "parts": [content]})
-                else:
-                    gemini_role = "user" if role == "user" else "model"
-                    gemini_messages.append({"role": gemini_role, "parts": [content]})
+            gemini_messages = self._convert_messages(messages)
 
             generation_config = {}
             if max_tokens:
@@ -108,8 +113,7 @@ class GeminiProvider(BaseProvider):
             if temperature:
                 generation_config["temperature"] = temperature
 
-            model_instance = genai.GenerativeModel(model)
-            response = await model_instance.generate_content_async(
+            response = await self._get_model(model).generate_content_async(
                 gemini_messages,
                 generation_config=generation_config,
                 stream=True,
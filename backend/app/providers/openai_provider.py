@@ -7,6 +7,7 @@ from openai import AsyncOpenAI
 from openai import APIError
 
 from app.config import config_manager, settings
+from app.core.http import shared_async_client
 from app.providers.base import BaseProvider, ProviderResponse
 from app.core.exceptions import ProviderException
 
@@ -16,17 +17,31 @@ class OpenAIProvider(BaseProvider):
 
     def __init__(self):
         super().__init__("openai")
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=shared_async_client,
+        )
         self.pricing = config_manager.get("providers.openai.pricing", {})
         self.max_retries = config_manager.get("providers.openai.max_retries", 3)
         self.retry_delay = config_manager.get("providers.openai.retry_delay", 1.0)
+        # Encodings per model: encoding_for_model resolves the model name
+        # and may load BPE data from disk, so do it once per model
+        self._encodings: Dict[str, tiktoken.Encoding] = {}
+
+    def _get_encoding(self, model: str) -> tiktoken.Encoding:
+        """Get the tiktoken encoding for a model, caching per model name."""
+        encoding = self._encodings.get(model)
+        if encoding is None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            self._encodings[model] = encoding
+        return encoding
 
     def _count_tokens(self, messages: List[Dict[str, str]], model: str) -> int:
         """Count tokens using tiktoken."""
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = self._get_encoding(model)
 
         tokens_per_message = 3  # Every message follows <|start|>assistant<|message|>
         tokens_per_name = 1  # If there's a name, the role is omitted
@@ -16,6 +16,9 @@ class OverviewStats(BaseModel):
     avg_duration_ms: float
     cache_hits: int
     pii_detections: int
+    # True when totals come from planner estimates/rollups instead of an
+    # exact scan (unfiltered dashboard queries)
+    approximate: bool = False
 
 
 class ProviderStats(BaseModel):
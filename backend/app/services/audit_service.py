@@ -1,7 +1,9 @@
 """Audit service for logging requests."""
 
+import asyncio
 from datetime import datetime
-from uuid import UUID
+from typing import List, Optional
+from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.request_repo import RequestRepository
@@ -11,6 +13,74 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+class _RequestLogBatcher:
+    """Coalesces request-log rows into batched INSERTs.
+
+    request_logs is the write hot spot — one row per gateway call. Rows
+    accumulate for up to _MAX_DELAY seconds or _MAX_BATCH rows, whichever
+    comes first, then flush as a single executemany INSERT, amortizing
+    the per-request write cost to a fraction of a roundtrip. IDs are
+    generated client-side so callers never block on RETURNING.
+    """
+
+    _MAX_BATCH = 500
+    _MAX_DELAY = 0.05
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def add(self, row: dict) -> None:
+        """Queue a row for insertion, starting the flush task if needed."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        await self._queue.put(row)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await self._queue.get()]
+            deadline = loop.time() + self._MAX_DELAY
+            while len(rows) < self._MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            await self._flush(rows)
+
+    async def _flush(self, rows: List[dict]) -> None:
+        async with AsyncSessionLocal() as db:
+            try:
+                await RequestRepository(db).create_many(rows)
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Failed to flush {len(rows)} request logs: {e}")
+                await db.rollback()
+
+    async def close(self) -> None:
+        """Stop the flush task and write out any queued rows."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        if rows:
+            await self._flush(rows)
+
+
+# Singleton instance shared by all AuditService objects
+request_log_batcher = _RequestLogBatcher()
+
+
 class AuditService:
     """Service for audit logging."""
 
@@ -36,9 +106,13 @@ class AuditService:
         status: str = "completed",
         error_message: str = None,
         guardrail_violations: list = None,
-    ):
+    ) -> UUID:
         """
-        Log a request to the database.
+        Log a request via the shared batch writer.
+
+        The row is queued with a client-generated id and inserted by the
+        batcher; the id is returned immediately without waiting for the
+        database write.
 
         Args:
             user_id: User ID
@@ -57,36 +131,31 @@ class AuditService:
             status: Request status
             error_message: Error message if failed
             guardrail_violations: List of guardrail violations
+
+        Returns:
+            The id assigned to the queued request log row
         """
-        # Use a separate session for async task to avoid transaction conflicts
-        async with AsyncSessionLocal() as db:
-            try:
-                request_repo = RequestRepository(db)
-                request_data = {
-                    "user_id": user_id,
-                    "request_timestamp": datetime.utcnow(),
-                    "provider": provider,
-                    "model": model,
-                    "messages": messages,
-                    "completion": completion,
-                    "prompt_tokens": prompt_tokens,
-                    "completion_tokens": completion_tokens,
-                    "total_tokens": total_tokens,
-                    "cost_usd": cost_usd,
-                    "duration_ms": duration_ms,
-                    "cache_hit": cache_hit,
-                    "pii_detected": pii_detected,
-                    "pii_entities": [e.to_dict() if hasattr(e, "to_dict") else e for e in (pii_entities or [])],
-                    "status": status,
-                    "error_message": error_message,
-                    "guardrail_violations": guardrail_violations,
-                }
-
-                request_log = await request_repo.create(request_data)
-                await db.commit()
-                return request_log
-            except Exception as e:
-                logger.error(f"Failed to log request: {e}")
-                await db.rollback()
-                return None
+        row_id = uuid4()
+        request_data = {
+            "id": row_id,
+            "user_id": user_id,
+            "request_timestamp": datetime.utcnow(),
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "completion": completion,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens,
+            "cost_usd": cost_usd,
+            "duration_ms": duration_ms,
+            "cache_hit": cache_hit,
+            "pii_detected": pii_detected,
+            "pii_entities": [e.to_dict() if hasattr(e, "to_dict") else e for e in (pii_entities or [])],
+            "status": status,
+            "error_message": error_message,
+            "guardrail_violations": guardrail_violations,
+        }
 
+        await request_log_batcher.add(request_data)
+        return row_id
@@ -1,9 +1,11 @@
 """Budget service for managing user spending limits."""
 
+import time
 from datetime import datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import read_cache
 from app.db.repositories.budget_repo import BudgetRepository
 from app.core.exceptions import BudgetExceededException
 from app.config import config_manager
@@ -40,6 +42,18 @@ class BudgetService:
         if not self._enabled:
             return True
 
+        # Fast path: a fresh cached budget that clearly allows the spend
+        # skips the DB entirely. Anything ambiguous (stale, past reset,
+        # would exceed) falls through to the authoritative check below.
+        cache_key = f"budget:{user_id}"
+        cached = await read_cache.get(cache_key)
+        if (
+            cached is not None
+            and time.time() < cached["reset_at"]
+            and cached["current_spend"] + cost <= cached["limit"]
+        ):
+            return True
+
         # Use a separate session to avoid nested transaction issues
         from app.db.session import AsyncSessionLocal
         async with AsyncSessionLocal() as db:
@@ -64,6 +78,16 @@ class BudgetService:
                     # Re-fetch updated budget
                     budget = await budget_repo.get_user_budget(user_id)
 
+                await read_cache.set(
+                    cache_key,
+                    {
+                        "current_spend": budget.current_spend,
+                        "limit": budget.limit,
+                        "reset_at": budget.reset_at.timestamp(),
+                    },
+                    ttl_seconds=30,
+                )
+
                 # Check if adding cost would exceed limit
                 if budget.current_spend + cost > budget.limit:
                     raise BudgetExceededException(
@@ -96,6 +120,7 @@ class BudgetService:
                 budget_repo = BudgetRepository(db)
                 await budget_repo.update_spend(user_id, cost)
                 await db.commit()
+                await read_cache.invalidate(f"budget:{user_id}")
             except Exception as e:
                 logger.error(f"Failed to track spend: {e}")
                 await db.rollback()
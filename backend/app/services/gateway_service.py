@@ -233,7 +233,7 @@ class GatewayService:
             logged_request_id = None
             async def log_and_get_id():
                 nonlocal logged_request_id
-                request_log = await self.audit_service.log_request(
+                request_log_id = await self.audit_service.log_request(
                     user_id=user_id,
                     provider=provider_used,
                     model=model_used,
@@ -250,14 +250,13 @@ class GatewayService:
                     status="completed",
                     guardrail_violations=guardrail_violations,
                 )
-                if request_log:
-                    logged_request_id = request_log.id
-                    # Update guardrail logs with request_id if violations exist
-                    if guardrail_violations:
-                        await self._update_guardrail_logs_request_id(
-                            user_id=user_id,
-                            request_id=logged_request_id,
-                        )
+                logged_request_id = request_log_id
+                # Update guardrail logs with request_id if violations exist
+                if guardrail_violations:
+                    await self._update_guardrail_logs_request_id(
+                        user_id=user_id,
+                        request_id=logged_request_id,
+                    )
             
             asyncio.create_task(log_and_get_id())
 
@@ -318,7 +317,7 @@ class GatewayService:
 
             # Log error
             async def log_error_and_update():
-                request_log = await self.audit_service.log_request(
+                request_log_id = await self.audit_service.log_request(
                     user_id=user_id,
                     provider=provider or "unknown",
                     model=model or "unknown",
@@ -334,10 +333,10 @@ class GatewayService:
                     guardrail_violations=guardrail_violations,
                 )
                 # Update guardrail logs with request_id if violations exist
-                if request_log and guardrail_violations:
+                if guardrail_violations:
                     await self._update_guardrail_logs_request_id(
                         user_id=user_id,
-                        request_id=request_log.id,
+                        request_id=request_log_id,
                     )
             
             asyncio.create_task(log_error_and_update())
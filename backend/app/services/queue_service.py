@@ -17,5 +17,5 @@ class QueueService:
         Returns:
             Message ID
         """
-        return await queue.enqueue(data)
+        return (await queue.enqueue(data)).decode()
 
@@ -17,7 +17,10 @@ logger = get_logger(__name__)
 class StreamingService:
     """Service for streaming completions."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: Optional[AsyncSession] = None):
+        # Streaming holds its HTTP connection open for many seconds, so no
+        # request-scoped session is passed in; DB work (none currently)
+        # should use call-scoped sessions via dependencies.get_db_short
         self.db = db
 
     async def stream_completion(
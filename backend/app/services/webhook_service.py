@@ -7,8 +7,10 @@ import asyncio
 from typing import List, Dict, Any
 from uuid import UUID
 import httpx
+from types import SimpleNamespace
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import read_cache
 from app.db.repositories.webhook_repo import WebhookRepository
 from app.config import config_manager
 from app.utils.logger import get_logger
@@ -38,15 +40,30 @@ class WebhookService:
         if not self._enabled:
             return
 
+        # Subscriptions change rarely but are looked up on every event;
+        # serve the (url, secret) list from the read cache when possible
+        cache_key = f"webhooks:{event_type}"
+        cached = await read_cache.get(cache_key)
+        if cached is not None:
+            for entry in cached:
+                asyncio.create_task(
+                    self._deliver_webhook(SimpleNamespace(**entry), event_type, data)
+                )
+            return
+
         # Use a separate session to avoid transaction conflicts
         from app.db.session import AsyncSessionLocal
         async with AsyncSessionLocal() as db:
             try:
                 webhook_repo = WebhookRepository(db)
-                webhooks = await webhook_repo.get_active_webhooks(event_type)
-                
-                for webhook in webhooks:
-                    asyncio.create_task(self._deliver_webhook(webhook, event_type, data))
+                targets = await webhook_repo.get_active_webhooks(event_type)
+
+                await read_cache.set(cache_key, targets, ttl_seconds=60)
+
+                for entry in targets:
+                    asyncio.create_task(
+                        self._deliver_webhook(SimpleNamespace(**entry), event_type, data)
+                    )
             except Exception as e:
                 logger.error(f"Failed to get webhooks: {e}")
                 # Don't raise - webhooks are not critical